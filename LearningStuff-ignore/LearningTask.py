@@ -6,13 +6,57 @@ from langgraph.graph import StateGraph, END
 from langchain_core.messages import HumanMessage, AIMessage
 from tavily import TavilyClient
 import re
+import heapq
+import logging
+import asyncio
+import functools
+from urllib.parse import urlsplit, parse_qsl, urlencode
 
 # Load environment variables from .env file
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Initialize Tavily client with API key
 tavily_client = TavilyClient(api_key=os.getenv("TAVILY_API_KEY"))
 
+# Precompiled patterns used by extract_developer_info
+_NAME_RE = re.compile(r'^([A-Za-z\s]+?)(?:\s*[-–|]|\s*\d|\s*$)')
+_EXP_RE = re.compile(r'(\d+)\+?\s*years?\s*(?:of\s*)?(?:experience|exp)', re.IGNORECASE)
+_RATING_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(?:stars?|rating|\/5)', re.IGNORECASE)
+_RATE_RE = re.compile(r'\$(\d+)(?:\.\d+)?\/(?:hour|hr)', re.IGNORECASE)
+
+# Search refinement keywords
+MERN_KEYWORDS = ("MongoDB", "Express.js", "React", "Node.js")
+AI_KEYWORDS = ("Machine Learning", "AI", "Artificial Intelligence", "Deep Learning", "TensorFlow", "PyTorch")
+QUALITY_INDICATORS = ("top rated", "expert level", "5 stars", "certified", "experienced")
+ALL_KEYWORDS = MERN_KEYWORDS + AI_KEYWORDS + QUALITY_INDICATORS
+
+# Comprehensive search queries, most comprehensive first
+SEARCH_QUERIES = (
+    "MERN stack developer MongoDB Express React Node.js AI machine learning site:upwork.com/freelancers",
+    "full stack developer React Node.js MongoDB artificial intelligence top rated site:upwork.com",
+    "JavaScript developer React Express MongoDB AI deep learning expert site:upwork.com/freelancers",
+    "MERN developer artificial intelligence machine learning certified site:upwork.com",
+    "full stack JavaScript MongoDB React Node Express AI developer site:upwork.com/freelancers"
+)
+
+# Descriptive risk levels indexed by risk score (1-5)
+_RISK_LEVELS = (None, "Very Low Risk", "Low Risk", "Medium Risk", "High Risk", "Very High Risk")
+
+# Skills detected in developer profiles
+MERN_SKILLS = ("MongoDB", "Express", "React", "Node", "JavaScript", "Full Stack")
+AI_SKILLS = ("AI", "Machine Learning", "Deep Learning", "TensorFlow", "PyTorch", "NLP")
+_SKILL_NAMES = {skill.lower(): skill for skill in MERN_SKILLS + AI_SKILLS}
+_AI_SKILL_KEYS = frozenset({"ai", "machine learning", "deep learning"})
+
+# One-pass scanner for every skill; the lookahead reports overlapping matches
+# the same way an Aho-Corasick automaton would, so the text is walked once
+_SKILL_RE = re.compile(
+    "(?=(" + "|".join(re.escape(s) for s in sorted(_SKILL_NAMES, key=len, reverse=True)) + "))",
+    re.IGNORECASE
+)
+
 # Define the comprehensive state for our multi-agent system
 class DeveloperSearchState(TypedDict):
     # Input
@@ -20,6 +64,7 @@ class DeveloperSearchState(TypedDict):
 
     # Search Refinement Agent:
     refined_search_query: str  # Refined search query after processing
+    refined_search_queries: List[str]  # All search queries to run in parallel
     search_keywords: List[str]  # Keywords extracted from the refined query
 
     # Tavily Search
@@ -27,6 +72,8 @@ class DeveloperSearchState(TypedDict):
 
     # Risk Assessment Agent:
     evaluated_developers: List[Dict[str, Any]]  # Developers evaluated for risk
+    risk_score_sum: int  # Sum of risk scores, accumulated during evaluation
+    risk_score_count: int  # Number of scored developers
 
     #Final Output
     final_recommendations: List[Dict[str, Any]]  # Final recommendations for the user
@@ -42,39 +89,24 @@ def search_refinement_agent(state: DeveloperSearchState) -> DeveloperSearchState
     """
     This agent refines the user's search query and extracts keywords.
     """
-    print("Running Search Refinement Agent...")
-    print("=" * 50)
+    logger.debug("Running Search Refinement Agent...")
+
+    user_request = state["user_request"]
+    logger.debug("Processing request: %s", user_request)
 
-    user_request = state.get("user_request", "")
-    print(f"Processing Request: {user_request}")
-
-    #Extract key technologies and skills
-    mern_keywords = ["MongoDB", "Express.js", "React", "Node.js"]
-    ai_keywords = ["Machine Learning", "AI", "Artificial Intelligence", "Deep Learning", "TensorFlow", "PyTorch"]
-    quality_indicators = ["top rated", "expert level", "5 stars", "certified", "experienced"]
-
-    #Create comprehensive search queries
-    search_queries = [
-        "MERN stack developer MongoDB Express React Node.js AI machine learning site:upwork.com/freelancers",
-        "full stack developer React Node.js MongoDB artificial intelligence top rated site:upwork.com",
-        "JavaScript developer React Express MongoDB AI deep learning expert site:upwork.com/freelancers",
-        "MERN developer artificial intelligence machine learning certified site:upwork.com",
-        "full stack JavaScript MongoDB React Node Express AI developer site:upwork.com/freelancers"
-    ]
-     
     # Select the most comprehensive query
-    refined_query = search_queries[0]
+    refined_query = SEARCH_QUERIES[0]
     
     #Extract all relevant kewords
-    all_keywords = mern_keywords + ai_keywords + quality_indicators
+    all_keywords = list(ALL_KEYWORDS)
 
     state["refined_search_query"] = refined_query
+    state["refined_search_queries"] = list(SEARCH_QUERIES)
     state["search_keywords"] = all_keywords
     state["current_step"] = "search_refinement_complete"
 
-    print(f"🎯 Refined Search Query: {refined_query}")
-    print(f"🏷️  Keywords Extracted: {', '.join(all_keywords[:8])}...")
-    print("✅ Search refinement complete!")
+    logger.debug("Refined search query: %s", refined_query)
+    logger.debug("Keywords extracted: %s...", ", ".join(all_keywords[:8]))
     
     # Add to conversation history
     state["messages"].append(
@@ -85,76 +117,132 @@ def search_refinement_agent(state: DeveloperSearchState) -> DeveloperSearchState
 
 # ==================== AGENT 2: TAVILY SEARCH AGENT ====================
 
-def tavily_search_agent(state: DeveloperSearchState) -> DeveloperSearchState:
+async def tavily_search_agent(state: DeveloperSearchState) -> DeveloperSearchState:
     """
     This agent performs the actual web search using Tavily.
+    All predefined queries run concurrently and their results are merged.
     """
-    print("Running Tavily Search Agent...")
-    print("=" * 50)
+    logger.debug("Running Tavily Search Agent...")
 
-    search_query = state.get("refined_search_query", "")
-    print(f"Performing search for: {search_query}")
+    search_query = state["refined_search_query"]
+    search_queries = state["refined_search_queries"] or [search_query]
+    logger.debug("Performing %d searches, primary query: %s", len(search_queries), search_query)
 
     try:
-        #Execute search using Tavily
-        response = tavily_client.search(
-            query=search_query,
-            search_depth="advanced",
-            max_results=10,  # Limit to 10 results for better performance
-            include_answer=True,  # Include direct answers if available
-            include_raw_content=True
-        )
+        #Execute all searches concurrently; the Tavily client is blocking so each call runs in a worker thread
+        responses = await asyncio.gather(*[
+            asyncio.to_thread(
+                cached_tavily_search,
+                query,
+                search_depth="advanced",
+                max_results=10  # Limit to 10 results for better performance
+            )
+            for query in search_queries
+        ])
+
+        #Merge results, keeping the first occurrence of each profile (O(n) hash-based dedup)
+        #and counting how many queries surfaced it
+        merged_results = {}
+        query_hits = {}
+        for query_response in responses:
+            for result in query_response.get('results', []):
+                key = canonical_url(result.get('url', ''))
+                merged_results.setdefault(key, result)
+                query_hits[key] = query_hits.get(key, 0) + 1
+
+        #Profiles found by more queries rank first; ties keep their original order
+        ranked_keys = sorted(merged_results, key=lambda key: -query_hits[key])
+
+        response = {
+            "query": search_query,
+            "answer": responses[0].get("answer") if responses else None,
+            "results": [merged_results[key] for key in ranked_keys[:10]]
+        }
 
         state["raw_search_results"] = response
         state["current_step"] = "tavily_search_complete"
 
         results_count = len(response.get('results', []))
-        print(f"🌐 Found {results_count} results for query: {search_query}")
-
-        # Preview first few results
-        for i, result in enumerate(response.get('results', [])[:3], 1):
-            title = result.get('title', 'No Title')[:60]
-            url = result.get('url', 'No URL')
-            content = result.get('content', 'No content')[:200] + "..."
-            print(f"{i}. **{title}**\n   URL: {url}\n   Content: {content}\n")
-
-        print("✅ Tavily search complete!")
+        logger.debug("Found %d results for query: %s", results_count, search_query)
+
+        # Preview first few results (skipped entirely unless debugging)
+        if logger.isEnabledFor(logging.DEBUG):
+            preview = []
+            for i, result in enumerate(response.get('results', [])[:3], 1):
+                title = result.get('title', 'No Title')[:60]
+                url = result.get('url', 'No URL')
+                content = result.get('content', 'No content')[:200] + "..."
+                preview.append(f"{i}. **{title}**\n   URL: {url}\n   Content: {content}\n")
+            logger.debug("Top results:\n%s", "".join(preview))
         
         # Add to conversation history
         state["messages"].append(
             AIMessage(content=f"Found {results_count} developer profiles from web search")
         )
     except Exception as e:
-        print(f"❌ Search error: {str(e)}")
+        logger.error("Search error: %s", e)
         state["raw_search_results"] = {"results": [], "error": str(e)}
         state["current_step"] = "tavily_search_error"
     
     return state
 
+def canonical_url(url: str) -> str:
+    """
+    Normalize a profile URL for deduplication: host + path without trailing
+    slash, keeping only non-tracking query parameters.
+    """
+    parts = urlsplit(url)
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_")
+    ])
+    canonical = parts.netloc.lower() + parts.path.rstrip("/")
+    return f"{canonical}?{query}" if query else canonical
+
+@functools.lru_cache(maxsize=128)
+def _cached_tavily_search(query: str, search_depth: str, max_results: int) -> str:
+    """
+    Run a Tavily search and memoize the JSON-encoded response.
+    Responses are stored as strings because dicts are mutable and unhashable.
+    """
+    response = tavily_client.search(
+        query=query,
+        search_depth=search_depth,
+        max_results=max_results,
+        include_answer=True,  # Include direct answers if available
+        include_raw_content=True
+    )
+    return json.dumps(response)
+
+def cached_tavily_search(query: str, search_depth: str = "advanced", max_results: int = 10) -> Dict[str, Any]:
+    """Return a fresh copy of the (possibly cached) Tavily response for a query."""
+    return json.loads(_cached_tavily_search(query, search_depth, max_results))
+
 # ==================== AGENT 3: RISK ASSESSMENT AGENT ====================
 
 def risk_assessment_agent(state: DeveloperSearchState) -> DeveloperSearchState:
     """
     This agent evaluates the developers found in the search results for risk.
     """
-    print("Running Risk Assessment Agent...")
-    print("=" * 50)
+    logger.debug("Running Risk Assessment Agent...")
 
-    raw_results = state.get("raw_search_results", {})
+    raw_results = state["raw_search_results"]
     search_results = raw_results.get('results', [])
 
     if not search_results:
-        print("❌ No search results to evaluate.")
+        logger.warning("No search results to evaluate.")
         state["evaluated_developers"] = []
+        state["risk_score_sum"] = 0
+        state["risk_score_count"] = 0
         state["current_step"] = "risk_assessment_complete"
         return state
     
-    print(f"📋 Analyzing {len(search_results)} developer profiles...")
+    logger.debug("Analyzing %d developer profiles...", len(search_results))
     
     evaluated_developers = []
+    risk_score_total = 0
 
     for i, result in enumerate(search_results[:5], 1):
-        print(f"Evaluating profile {i}:")
 
         #Extract basic information
         title = result.get('title', 'Unknown Developer')
@@ -178,21 +266,25 @@ def risk_assessment_agent(state: DeveloperSearchState) -> DeveloperSearchState:
             "rating": developer_profile.get("rating", "Not specified"),
             "hourly_rate": developer_profile.get("rate", "Not specified"),
             "risk_score": risk_score,
-            "risk_level": get_risk_level(risk_score),
+            "risk_level": _RISK_LEVELS[risk_score],  # risk_score is already clamped to 1-5
             "risk_factors": developer_profile.get("risk_factors", []),
             "strengths": developer_profile.get("strengths", []),
             "summary": content[:200] + "..." if len(content) > 200 else content
         }
 
         evaluated_developers.append(structured_profile)
-        print(f"   👤 Name: {structured_profile['name']}")
-        print(f"   ⭐ Risk Score: {risk_score}/5 ({structured_profile['risk_level']})")
-        print(f"   🔗 Profile: {url[:50]}...")
+        risk_score_total += risk_score
+        logger.debug(
+            "Evaluated profile %d: %s, risk %d/5 (%s), %s",
+            i, structured_profile["name"], risk_score, structured_profile["risk_level"], url
+        )
     
     state["evaluated_developers"] = evaluated_developers
+    state["risk_score_sum"] = risk_score_total
+    state["risk_score_count"] = len(evaluated_developers)
     state["current_step"] = "risk_assessment_complete"
 
-    print(f"\n✅ Risk assessment complete! Evaluated {len(evaluated_developers)} developers")
+    logger.debug("Risk assessment complete! Evaluated %d developers", len(evaluated_developers))
     
     # Add to conversation history
     state["messages"].append(
@@ -217,43 +309,36 @@ def extract_developer_info(title: str, content: str, url: str) -> Dict[str, Any]
    }
     
     # Extract name (if available)
-    name_match = re.search(r'^([A-Za-z\s]+?)(?:\s*[-–|]|\s*\d|\s*$)', title)
+    name_match = _NAME_RE.search(title)
     if name_match:
         profile["name"] = name_match.group(1).strip()
 
-    # Extract Skills
-    mern_skills = ["MongoDB", "Express", "React", "Node", "JavaScript", "Full Stack"]
-    ai_skills = ["AI", "Machine Learning", "Deep Learning", "TensorFlow", "PyTorch", "NLP"]
-
-    found_skills = []
-    text_to_search = (title + " " + content).lower()
-
-    for skill in mern_skills + ai_skills:
-        if skill.lower() in text_to_search:
-            found_skills.append(skill)
+    # Extract Skills (title and content are scanned separately to avoid copying them into one string)
+    matched = {m.group(1).lower() for text in (title, content) for m in _SKILL_RE.finditer(text)}
+    found_skills = [skill for key, skill in _SKILL_NAMES.items() if key in matched]
     profile["skills"] = found_skills
 
     # Extract Experience
-    exp_match = re.search(r'(\d+)\+?\s*years?\s*(?:of\s*)?(?:experience|exp)', content.lower())
+    exp_match = _EXP_RE.search(content)
     if exp_match:
         profile["experience"] = f"{exp_match.group(1)} years"
 
     # Extract rating
-    rating_match = re.search(r'(\d+(?:\.\d+)?)\s*(?:stars?|rating|\/5)', content.lower())
+    rating_match = _RATING_RE.search(content)
     if rating_match:
         profile["rating"] = f"{rating_match.group(1)}/5"
     
     # Extract hourly rate
-    rate_match = re.search(r'\$(\d+)(?:\.\d+)?\/(?:hour|hr)', content.lower())
+    rate_match = _RATE_RE.search(content)
     if rate_match:
         profile["rate"] = f"${rate_match.group(1)}/hour"
     
     # Determine strengths
     if len(found_skills) >= 6:
         profile["strengths"].append("Strong technical skill set")
-    if "react" in text_to_search and "node" in text_to_search:
+    if "react" in matched and "node" in matched:
         profile["strengths"].append("Full MERN stack experience")
-    if any(ai in text_to_search for ai in ["ai", "machine learning", "deep learning"]):
+    if not _AI_SKILL_KEYS.isdisjoint(matched):
         profile["strengths"].append("AI/ML expertise")
     if "upwork.com" in url:
         profile["strengths"].append("Upwork verified profile")
@@ -264,41 +349,43 @@ def calculate_risk_score(profile: Dict[str, Any], content: str) -> int:
     """
     Calculate risk score from 1 (low risk) to 5 (high risk)
     """
-    risk_score = 3  # Default to medium risk
+    # Scores are tracked in half-points so every adjustment stays integer arithmetic
+    half_points = 6  # Default to medium risk (3)
+    skills = profile.get("skills") or ()
+    n_skills = len(skills)
 
     #Reduce risk for positive factors
-    if len(profile.get("skills", [])) >= 6:
-        risk_score -= 1 # Strong skill set
-    if "AI" in profile.get("skills", []) or "Machine Learning" in profile.get("skills", []):
-        risk_score -= 1 # AI expertise
+    if n_skills >= 6:
+        half_points -= 2 # Strong skill set
+    if "AI" in skills or "Machine Learning" in skills:
+        half_points -= 2 # AI expertise
     if profile.get("rating", "").startswith(("4", "5")):
-        risk_score -= 0.5  # High rating
+        half_points -= 1  # High rating
     
-    if "experience" in profile and any(num in profile["experience"] for num in ["3", "4", "5", "6", "7", "8", "9"]):
-        risk_score -= 0.5  # Good experience
+    experience = profile.get("experience", "")
+    if experience[:1].isdigit() and int(experience.split()[0]) >= 3:
+        half_points -= 1  # Good experience (3+ years)
     
     # Increase risk for negative factors
-    if len(profile.get("skills", [])) < 3:
-        risk_score += 1  # Limited skills
+    if n_skills < 3:
+        half_points += 2  # Limited skills
     
-    if "Unknown" in [profile.get("experience", ""), profile.get("rating", "")]:
-        risk_score += 0.5  # Missing information
+    if experience == "Unknown" or profile.get("rating", "") == "Unknown":
+        half_points += 1  # Missing information
     
+    # Convert back to whole points, rounding halves to even like round() does
+    risk_score, half = divmod(half_points, 2)
+    if half and risk_score % 2:
+        risk_score += 1
+
     # Ensure score is within bounds
-    risk_score = max(1, min(5, int(round(risk_score))))
+    risk_score = max(1, min(5, risk_score))
     
     return risk_score
 
 def get_risk_level(score: int) -> str:
     """Convert numeric risk score to descriptive level"""
-    levels = {
-        1: "Very Low Risk",
-        2: "Low Risk", 
-        3: "Medium Risk",
-        4: "High Risk",
-        5: "Very High Risk"
-    }
-    return levels.get(score, "Unknown Risk")
+    return _RISK_LEVELS[max(1, min(5, score))]
 
 # ==================== FINAL RECOMMENDATION AGENT ====================
 
@@ -306,37 +393,31 @@ def final_recommendation_agent(state: DeveloperSearchState) -> DeveloperSearchSt
     """
     Agent 4: Creates final recommendations and rankings
     """
-    print("Running Final Recommendation Agent...")
-    print("=" * 50)
+    logger.debug("Running Final Recommendation Agent...")
 
-    evaluated_developers = state.get("evaluated_developers", [])
+    evaluated_developers = state["evaluated_developers"]
 
     if not evaluated_developers:
-        print("❌ No developers to recommend.")
+        logger.warning("No developers to recommend.")
         state["final_recommendations"] = []
         state["current_step"] = "final_recommendation_complete"
         return state
     
-    #Sort developers by risk score (ascending)
-
-    sorted_developers = sorted(
+    #Select top 5 developers by risk score (ascending), then by number of skills
+    top_5 = heapq.nsmallest(
+        5,
         evaluated_developers,
-        key=lambda x: (x["risk_score"], -len(x["skills"]))  # Sort by risk score, then by number of skills
+        key=lambda x: (x["risk_score"], -len(x["skills"]))
         )
-    
-    #Select top 5 developers
-    top_5 = sorted_developers[:5]
-
-    print(f"🏆 Top {len(top_5)} Recommended Developers:")
 
-    for i, dev in enumerate(top_5, 1):
-        print(f"\n{i}. {dev['name']}")
-        print(f"   🎯 Risk Level: {dev['risk_level']} (Score: {dev['risk_score']}/5)")
-        print(f"   💼 Skills: {', '.join(dev['skills'][:5])}")
-        print(f"   ⭐ Rating: {dev['rating']}")
-        print(f"   💰 Rate: {dev['hourly_rate']}")
-        print(f"   🔗 Profile: {dev['profile_url']}")
-        print(f"   ✅ Strengths: {', '.join(dev['strengths'])}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Top %d recommended developers:", len(top_5))
+        for i, dev in enumerate(top_5, 1):
+            logger.debug(
+                "%d. %s | %s (Score: %d/5) | Skills: %s | Rating: %s | Rate: %s | %s | Strengths: %s",
+                i, dev["name"], dev["risk_level"], dev["risk_score"], ", ".join(dev["skills"][:5]),
+                dev["rating"], dev["hourly_rate"], dev["profile_url"], ", ".join(dev["strengths"])
+            )
 
     state["final_recommendations"] = top_5
     state["current_step"] = "recommendations_complete"
@@ -347,7 +428,7 @@ def final_recommendation_agent(state: DeveloperSearchState) -> DeveloperSearchSt
     
     state["messages"].append(AIMessage(content=summary))
     
-    print(f"\n✅ Final recommendations ready! Best match: {top_5[0]['name']}")
+    logger.debug("Final recommendations ready! Best match: %s", top_5[0]["name"])
 
     
     return state
@@ -359,7 +440,7 @@ def create_developer_search_workflow():
     """
     Create the complete multi-agent workflow
     """
-    print("🏗️  Building Multi-Agent Developer Search Workflow...")
+    logger.debug("Building multi-agent developer search workflow...")
 
     # Initialize the workflow
     workflow = StateGraph(DeveloperSearchState)
@@ -377,12 +458,12 @@ def create_developer_search_workflow():
     workflow.add_edge("risk_assessment", "recommendation_agent")
     workflow.add_edge("recommendation_agent", END)
 
-    print("✅ Workflow built successfully!")
+    logger.debug("Workflow built successfully!")
     return workflow.compile()
 
 # ==================== MAIN EXECUTION FUNCTION ====================
 
-def find_mern_ai_developers(user_request: str):
+async def find_mern_ai_developers(user_request: str):
     """
     Main function to execute the complete developer search workflow
     """
@@ -394,13 +475,16 @@ def find_mern_ai_developers(user_request: str):
     # Create workflow
     app = create_developer_search_workflow()
     
-    # Initial state
+    # Initial state; every field is pre-populated so agents can index state directly
     initial_state = {
         "user_request": user_request,
         "refined_search_query": "",
+        "refined_search_queries": [],
         "search_keywords": [],
         "raw_search_results": {},
         "evaluated_developers": [],
+        "risk_score_sum": 0,
+        "risk_score_count": 0,
         "final_recommendations": [],
         "messages": [HumanMessage(content=user_request)],
         "current_step": "initialized"
@@ -408,18 +492,19 @@ def find_mern_ai_developers(user_request: str):
 
     try:
         # Execute the complete workflow
-        final_state = app.invoke(initial_state)
+        final_state = await app.ainvoke(initial_state)
         
         print("\n" + "=" * 70)
         print("🎉 SEARCH MISSION ACCOMPLISHED!")
         print("=" * 70)
         
         # Display final summary
-        recommendations = final_state.get("final_recommendations", [])
+        recommendations = final_state["final_recommendations"]
         if recommendations:
             print(f"✅ Successfully found {len(recommendations)} qualified developers")
             print(f"🏆 Top recommendation: {recommendations[0]['name']}")
-            print(f"⚡ Average risk level: {sum(d['risk_score'] for d in recommendations)/len(recommendations):.1f}/5")
+            # Every evaluated developer (at most 5) is recommended, so the running sum covers the same set
+            print(f"⚡ Average risk level: {final_state['risk_score_sum'] / final_state['risk_score_count']:.1f}/5")
         else:
             print("⚠️  No suitable developers found. Try refining search criteria.")
         
@@ -431,6 +516,7 @@ def find_mern_ai_developers(user_request: str):
     
 # ==================== INTERACTIVE EXECUTION ====================
 if __name__ == "__main__":
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
     print("🤖 MERN + AI Developer Search Agent")
     print("Powered by Multi-Agent LangGraph Workflow")
     print("=" * 50)
@@ -456,7 +542,7 @@ if __name__ == "__main__":
             break
             
         if user_input:
-            result = find_mern_ai_developers(user_input)
+            result = asyncio.run(find_mern_ai_developers(user_input))
             
             if result and result.get("final_recommendations"):
                 print(f"\n💡 Quick Summary:")
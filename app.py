@@ -3,6 +3,7 @@ Main application entry point that combines both the Talent Scraper and Term Simp
 This provides a cleaner interface and brings together both components.
 """
 import logging
+import orjson
 import os
 
 # Setup logging first
@@ -11,14 +12,15 @@ logging.basicConfig(level=getattr(logging, log_level))
 logger = logging.getLogger(__name__)
 
 # Standard imports
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException
 import uvicorn
 from fastapi.staticfiles import StaticFiles
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from fastapi.templating import Jinja2Templates
 from dotenv import load_dotenv
 
 # Import modules
-from talent_scraper_chatbot import TalentScraperChatbot
+from llm_client import warm_clients, close_clients
 
 # Load environment variables
 load_dotenv()
@@ -28,6 +30,7 @@ app = FastAPI(
     title="AI Talent Tools",
     description="AI-powered talent hunting and technical term simplification",
     version="2.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Mount static files
@@ -36,12 +39,13 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 # Setup templates
 templates = Jinja2Templates(directory="templates")
 
-# Initialize the talent scraper chatbot
-chatbot = TalentScraperChatbot()
+# The demo page has no per-request variables, so render it once at startup
+demo_page_html = templates.get_template("demo.html").render()
 
 # Import API routers from our modules
 from term_simplifier.api import router as simplifier_router
 from talent_scraper.api import router as talent_router
+from talent_scraper.limiter import chat_limiter
 
 # Include the term simplifier API routes
 app.include_router(simplifier_router)
@@ -49,47 +53,66 @@ app.include_router(simplifier_router)
 # Include the talent scraper API routes
 app.include_router(talent_router, prefix="/api/v1", tags=["talent"])
 
+@app.on_event("startup")
+async def startup_clients():
+    """Warm the shared OpenAI connection pool."""
+    await warm_clients()
+
+@app.on_event("shutdown")
+async def shutdown_clients():
+    """Close the shared OpenAI connection pool."""
+    await close_clients()
+
 # Root endpoint
+# The root payload never changes, so it is serialized once
+_ROOT_BYTES = orjson.dumps({
+    "message": "AI Talent Tools API",
+    "description": "API for AI-powered talent hunting and technical term simplification",
+    "version": "2.0.0",
+    "capabilities": [
+        "Natural language talent search",
+        "Multi-platform scraping (Upwork, LinkedIn, GitHub)",
+        "AI-powered candidate evaluation",
+        "Conversational interface",
+        "Risk assessment and ranking",
+        "Technical term simplification"
+    ],
+    "endpoints": {
+        "talent_api": "/api/v1",
+        "simplifier_api": "/simplifier",
+        "simplifier_demo": "/simplifier-demo",
+        "health": "/health",
+        "docs": "/docs"
+    }
+})
+
 @app.get("/")
 async def root_endpoint():
     """Root endpoint with API information."""
-    return {
-        "message": "AI Talent Tools API",
-        "description": "API for AI-powered talent hunting and technical term simplification",
-        "version": "2.0.0",
-        "capabilities": [
-            "Natural language talent search",
-            "Multi-platform scraping (Upwork, LinkedIn, GitHub)",
-            "AI-powered candidate evaluation",
-            "Conversational interface",
-            "Risk assessment and ranking",
-            "Technical term simplification"
-        ],
-        "endpoints": {
-            "talent_api": "/api/v1",
-            "simplifier_api": "/simplifier",
-            "simplifier_demo": "/simplifier-demo",
-            "health": "/health",
-            "docs": "/docs"
-        }
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 # Health check endpoint
+# Static part of the health payload, serialized once; only the live chat count is added per probe
+_HEALTH_PREFIX = orjson.dumps({
+    "status": "healthy",
+    "service": "AI Talent Tools API",
+    "openai_configured": bool(os.getenv("OPENAI_API_KEY")),
+    "tavily_configured": bool(os.getenv("TAVILY_API_KEY"))
+})[:-1] + b',"active_chats":'
+
 @app.get("/health")
 async def health_check_endpoint():
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "service": "AI Talent Tools API",
-        "openai_configured": bool(os.getenv("OPENAI_API_KEY")),
-        "tavily_configured": bool(os.getenv("TAVILY_API_KEY"))
-    }
+    return Response(
+        content=_HEALTH_PREFIX + str(chat_limiter.count).encode() + b"}",
+        media_type="application/json"
+    )
 
 # Demo page for the term simplifier
 @app.get("/simplifier-demo", include_in_schema=False)
-async def simplifier_demo_page(request: Request):
+async def simplifier_demo_page():
     """Demo page for the technical term simplifier."""
-    return templates.TemplateResponse("demo.html", {"request": request})
+    return HTMLResponse(content=demo_page_html)
 
 if __name__ == "__main__":
     print("🚀 Starting AI Talent Tools API...")
@@ -97,10 +120,13 @@ if __name__ == "__main__":
     print("🔍 Technical term simplifier enabled")
     print("📚 API Documentation: http://localhost:8000/docs")
     
+    # Auto-reload (single process) only in development; otherwise fan out across worker processes
+    dev_mode = bool(os.getenv("DEV"))
     uvicorn.run(
         "app:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=dev_mode,
+        workers=1 if dev_mode else int(os.getenv("WORKERS", "1")),
         log_level=log_level.lower()
     )
@@ -1,22 +1,29 @@
-from fastapi import FastAPI, HTTPException, APIRouter, Request
-from pydantic import BaseModel
+from fastapi import FastAPI, HTTPException, Request
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from typing import List, Optional
 import os
-import asyncio
 import logging
-from talent_scraper_chatbot import TalentScraperChatbot, ChatbotResponse
+import orjson
+from talent_scraper_chatbot import ChatbotResponse, NO_HISTORY_SUMMARY
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from term_simplifier.api import router as simplifier_router
+from llm_client import warm_clients, close_clients
+from talent_scraper.limiter import chat_limiter
+from talent_scraper.sessions import find_chat_session, get_chat_session, reset_chat_session
+from talent_scraper.api import stream_chat
 
 # Setup logging
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
 logger = logging.getLogger(__name__)
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Talent Scraper Chatbot API",
     description="AI-powered talent scraping chatbot using OpenAI + Tavily",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Mount static files after initializing the app
@@ -25,24 +32,21 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 # Setup templates
 templates = Jinja2Templates(directory="templates")
 
-# Initialize the chatbot
-chatbot = TalentScraperChatbot()
-
-# Create a simplifier router
-simplifier_router = APIRouter(prefix="/simplifier", tags=["simplifier"])
-
 # Pydantic models
 class ChatRequest(BaseModel):
-    message: str
-    session_id: Optional[str] = "default"
-    
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "message": "Find me 3 senior React developers with AI experience",
                 "session_id": "user123"
             }
         }
+    )
+    
+    message: str
+    session_id: Optional[str] = "default"
 
 class ChatResponse(BaseModel):
     response: str
@@ -52,114 +56,74 @@ class ChatResponse(BaseModel):
     conversation_context: Optional[str] = None
     session_id: str
 
-# Simplifier Routes
-@simplifier_router.post("/explain")
-async def explain_term(request: Request):
-    """Get a simplified explanation of a technical term."""
-    try:
-        # Get the request body
-        body = await request.json()
-        term = body.get("term", "")
-
-        logger.info(f"Received simplification request for term: '{term}'")
-        
-        if not term:
-            logger.warning("Empty term received in request")
-            raise HTTPException(status_code=400, detail="Term is required")
-            
-        # Use the chatbot's OpenAI client
-        from talent_scraper_chatbot import openai_client
-        
-        response = await openai_client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {
-                    "role": "system",
-                    "content": """You are a helpful assistant that explains technical terms in extremely 
-                    simple, non-technical language. Your target audience is people with no technical 
-                    background at all. Use everyday analogies, avoid all jargon, and keep explanations 
-                    under 2-3 short sentences. Use the simplest language possible, like explaining to a child."""
-                },
-                {
-                    "role": "user",
-                    "content": f"Explain '{term}' in the simplest way possible. No technical terms allowed."
-                }
-            ],
-            max_tokens=100,
-            temperature=0.3
-        )
-        
-        explanation = response.choices[0].message.content.strip()
-        logger.info(f"Generated explanation for '{term}': {explanation[:30]}...")
-        
-        return {
-            "term": term,
-            "explanation": explanation,
-            "cached": False
-        }
-        
-    except Exception as e:
-        logger.error(f"Error generating explanation: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
-        raise HTTPException(
-            status_code=500, 
-            detail=f"Failed to generate explanation: {str(e)}"
-        )
-
-@simplifier_router.get("/test")
-async def test_simplifier():
-    """Test endpoint for the simplifier."""
-    return {
-        "status": "ok",
-        "message": "Simplifier API is working"
-    }
+# Built once so responses are serialized by pydantic-core without re-validation
+_CHAT_RESPONSE_ADAPTER = TypeAdapter(ChatResponse)
 
 # Include the simplifier router
 app.include_router(simplifier_router)
 
+@app.on_event("startup")
+async def startup_clients():
+    """Warm the shared OpenAI connection pool."""
+    await warm_clients()
+
+@app.on_event("shutdown")
+async def shutdown_clients():
+    """Close the shared OpenAI connection pool."""
+    await close_clients()
+
 # API Endpoints
+# The root payload never changes, so it is serialized once
+_ROOT_BYTES = orjson.dumps({
+    "message": "Talent Scraper Chatbot API",
+    "description": "AI-powered talent scraping using OpenAI + Tavily",
+    "version": "2.0.0",
+    "capabilities": [
+        "Natural language talent search",
+        "Multi-platform scraping (Upwork, LinkedIn, GitHub)",
+        "AI-powered candidate evaluation",
+        "Conversational interface",
+        "Risk assessment and ranking",
+        "Technical term simplification"
+    ],
+    "endpoints": {
+        "chat": "/api/v1/chat",
+        "health": "/health",
+        "reset": "/api/v1/reset-conversation", 
+        "simplifier": "/simplifier/explain",
+        "simplifier_demo": "/simplifier-demo",
+        "test_page": "/test-page",
+        "docs": "/docs"
+    }
+})
+
 @app.get("/")
 async def root():
     """Root endpoint with API information."""
-    return {
-        "message": "Talent Scraper Chatbot API",
-        "description": "AI-powered talent scraping using OpenAI + Tavily",
-        "version": "2.0.0",
-        "capabilities": [
-            "Natural language talent search",
-            "Multi-platform scraping (Upwork, LinkedIn, GitHub)",
-            "AI-powered candidate evaluation",
-            "Conversational interface",
-            "Risk assessment and ranking",
-            "Technical term simplification"
-        ],
-        "endpoints": {
-            "chat": "/api/v1/chat",
-            "health": "/health",
-            "reset": "/api/v1/reset-conversation", 
-            "simplifier": "/simplifier/explain",
-            "simplifier_demo": "/simplifier-demo",
-            "test_page": "/test-page",
-            "docs": "/docs"
-        }
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
+
+# Static part of the health payload, serialized once; only the live chat count is added per probe
+_HEALTH_PREFIX = orjson.dumps({
+    "status": "healthy",
+    "service": "Talent Scraper Chatbot API",
+    "chatbot_status": "ready",
+    "openai_configured": bool(os.getenv("OPENAI_API_KEY")),
+    "tavily_configured": bool(os.getenv("TAVILY_API_KEY"))
+})[:-1] + b',"active_chats":'
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "service": "Talent Scraper Chatbot API",
-        "chatbot_status": "ready",
-        "openai_configured": bool(os.getenv("OPENAI_API_KEY")),
-        "tavily_configured": bool(os.getenv("TAVILY_API_KEY"))
-    }
+    return Response(
+        content=_HEALTH_PREFIX + str(chat_limiter.count).encode() + b"}",
+        media_type="application/json"
+    )
 
 @app.post("/api/v1/chat", response_model=ChatResponse)
-async def chat_with_bot(request: ChatRequest):
+async def chat_with_bot(request: ChatRequest, stream: bool = False):
     """
     Chat with the talent scraper bot.
+    With ?stream=true the reply is sent as Server-Sent Events while it is generated.
     
     The bot can:
     - Understand natural language talent requests
@@ -167,41 +131,47 @@ async def chat_with_bot(request: ChatRequest):
     - Provide detailed candidate analysis
     - Engage in general conversation about talent needs
     """
-    try:
-        logger.info(f"💬 Chat request from {request.session_id}: {request.message}")
-        
-        # Process the chat message
-        bot_response = await chatbot.chat(request.message)
-        
-        # Build API response
-        response = ChatResponse(
-            response=bot_response.message,
-            search_performed=bot_response.search_performed,
-            talent_count=len(bot_response.talent_results) if bot_response.talent_results else None,
-            search_summary=bot_response.search_summary,
-            conversation_context=bot_response.conversation_context,
-            session_id=request.session_id
-        )
-        
-        logger.info(f"✅ Chat response generated for {request.session_id}")
-        return response
-        
-    except Exception as e:
-        logger.error(f"❌ Chat error: {str(e)}")
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error": "Internal server error",
-                "message": str(e),
-                "session_id": request.session_id
-            }
-        )
+    if stream:
+        return await stream_chat(request)
+    
+    async with chat_limiter:
+        try:
+            logger.info("💬 Chat request from %s: %s", request.session_id, request.message)
+            
+            # Process the chat message; only turns within the same session are serialized
+            chatbot, session_lock = get_chat_session(request.session_id)
+            async with session_lock:
+                bot_response = await chatbot.chat(request.message)
+            
+            # Build API response
+            response = ChatResponse(
+                response=bot_response.message,
+                search_performed=bot_response.search_performed,
+                talent_count=len(bot_response.talent_results) if bot_response.talent_results else None,
+                search_summary=bot_response.search_summary,
+                conversation_context=bot_response.conversation_context,
+                session_id=request.session_id
+            )
+            
+            logger.info("✅ Chat response generated for %s", request.session_id)
+            return ORJSONResponse(content=_CHAT_RESPONSE_ADAPTER.dump_python(response, mode="json"))
+            
+        except Exception as e:
+            logger.error("❌ Chat error: %s", e)
+            raise HTTPException(
+                status_code=500,
+                detail={
+                    "error": "Internal server error",
+                    "message": str(e),
+                    "session_id": request.session_id
+                }
+            )
 
 @app.post("/api/v1/reset-conversation")
 async def reset_conversation(session_id: str = "default"):
     """Reset conversation history for a session."""
     try:
-        chatbot.reset_conversation()
+        reset_chat_session(session_id)
         return {
             "success": True,
             "message": "Conversation history reset successfully",
@@ -211,9 +181,14 @@ async def reset_conversation(session_id: str = "default"):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/v1/conversation-summary")
-async def get_conversation_summary():
-    """Get current conversation summary."""
+async def get_conversation_summary(session_id: str = "default"):
+    """Get current conversation summary for a session."""
+    session = find_chat_session(session_id)
+    if session is None:
+        # Reading the summary of an unknown session must not create one
+        return {"success": True, "summary": NO_HISTORY_SUMMARY, "conversation_length": 0}
     try:
+        chatbot, _ = session
         summary = chatbot.get_conversation_summary()
         return {
             "success": True,
@@ -244,10 +219,13 @@ if __name__ == "__main__":
     print("🔍 Technical term simplifier enabled")
     print("📚 API Documentation: http://localhost:8000/docs")
     
+    # Auto-reload (single process) only in development; otherwise fan out across worker processes
+    dev_mode = bool(os.getenv("DEV"))
     uvicorn.run(
         "chatbot_api:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=dev_mode,
+        workers=1 if dev_mode else int(os.getenv("WORKERS", "1")),
         log_level="info"
     )
\ No newline at end of file
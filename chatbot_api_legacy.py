@@ -30,10 +30,13 @@ if __name__ == "__main__":
     print("🔍 Technical term simplifier enabled")
     print("📚 API Documentation: http://localhost:8000/docs")
     
+    # Auto-reload (single process) only in development; otherwise fan out across worker processes
+    dev_mode = bool(os.getenv("DEV"))
     uvicorn.run(
         "app:app",
-        host="0.0.0.0", 
+        host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=dev_mode,
+        workers=1 if dev_mode else int(os.getenv("WORKERS", os.cpu_count() or 1)),
         log_level="info"
     )
@@ -1,4 +1,5 @@
-import requests
+import asyncio
+import httpx
 import json
 
 class TalentChatbotClient:
@@ -7,8 +8,9 @@ class TalentChatbotClient:
     def __init__(self, base_url: str = "http://localhost:8000"):
         self.base_url = base_url
         self.session_id = "test_session_123"
+        self._client = httpx.AsyncClient(base_url=base_url, timeout=60)
     
-    def chat(self, message: str):
+    async def chat(self, message: str):
         """Send a chat message to the bot."""
         try:
             payload = {
@@ -18,11 +20,7 @@ class TalentChatbotClient:
             
             print(f"👤 You: {message}")
             
-            response = requests.post(
-                f"{self.base_url}/api/v1/chat",
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            )
+            response = await self._client.post("/api/v1/chat", json=payload)
             
             if response.status_code == 200:
                 result = response.json()
@@ -42,10 +40,14 @@ class TalentChatbotClient:
             print(f"❌ Chat error: {e}")
             return None
     
-    def reset_conversation(self):
+    async def chat_many(self, messages):
+        """Send several chat messages concurrently over the pooled connection."""
+        return await asyncio.gather(*(self.chat(message) for message in messages))
+    
+    async def reset_conversation(self):
         """Reset the conversation."""
         try:
-            response = requests.post(f"{self.base_url}/api/v1/reset-conversation?session_id={self.session_id}")
+            response = await self._client.post("/api/v1/reset-conversation", params={"session_id": self.session_id})
             if response.status_code == 200:
                 print("🔄 Conversation reset successfully")
                 return True
@@ -54,7 +56,16 @@ class TalentChatbotClient:
             print(f"❌ Reset error: {e}")
             return False
 
-def main():
+    async def health(self) -> bool:
+        """Check whether the API is up and healthy."""
+        response = await self._client.get("/health")
+        return response.status_code == 200
+    
+    async def aclose(self):
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+async def main():
     """Interactive chat session."""
     print("🚀 Talent Scraper Chatbot - Interactive Test")
     print("=" * 50)
@@ -67,43 +78,45 @@ def main():
     
     client = TalentChatbotClient()
     
-    # Test health first
     try:
-        health = requests.get(f"{client.base_url}/health")
-        if health.status_code != 200:
-            print("❌ API is not healthy. Make sure the server is running.")
-            return
-        print("✅ API is healthy and ready!")
-    except:
-        print("❌ Cannot connect to API. Make sure the server is running on localhost:8000")
-        return
-    
-    print("\n💬 Start chatting! (Type 'quit' to exit, 'reset' to reset conversation)")
-    
-    while True:
+        # Test health first
         try:
-            user_input = input("\n👤 You: ").strip()
-            
-            if user_input.lower() in ['quit', 'exit', 'q']:
-                print("👋 Goodbye!")
-                break
-            
-            if user_input.lower() == 'reset':
-                client.reset_conversation()
-                continue
-            
-            if user_input:
-                result = client.chat(user_input)
-                if not result:
-                    print("❌ Failed to get response. Please try again.")
-            else:
-                print("⚠️ Please enter a message.")
+            if not await client.health():
+                print("❌ API is not healthy. Make sure the server is running.")
+                return
+            print("✅ API is healthy and ready!")
+        except:
+            print("❌ Cannot connect to API. Make sure the server is running on localhost:8000")
+            return
+        
+        print("\n💬 Start chatting! (Type 'quit' to exit, 'reset' to reset conversation)")
+        
+        while True:
+            try:
+                user_input = (await asyncio.to_thread(input, "\n👤 You: ")).strip()
                 
-        except KeyboardInterrupt:
-            print("\n👋 Goodbye!")
-            break
-        except Exception as e:
-            print(f"❌ Error: {e}")
+                if user_input.lower() in ['quit', 'exit', 'q']:
+                    print("👋 Goodbye!")
+                    break
+                
+                if user_input.lower() == 'reset':
+                    await client.reset_conversation()
+                    continue
+                
+                if user_input:
+                    result = await client.chat(user_input)
+                    if not result:
+                        print("❌ Failed to get response. Please try again.")
+                else:
+                    print("⚠️ Please enter a message.")
+                    
+            except (KeyboardInterrupt, EOFError):
+                print("\n👋 Goodbye!")
+                break
+            except Exception as e:
+                print(f"❌ Error: {e}")
+    finally:
+        await client.aclose()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
@@ -0,0 +1,225 @@
+"""
+Shared API clients for the whole application.
+A single pooled HTTP client keeps connections to the OpenAI and Tavily APIs
+alive across requests instead of each module opening its own pool.
+"""
+import os
+import time
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+import httpx
+import openai
+from openai import AsyncOpenAI
+from tenacity import retry, retry_if_exception, retry_if_exception_type, stop_after_attempt, wait_random_exponential
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Seconds an idle pooled connection is kept; httpx defaults to 5s, which would make
+# nearly every chat turn pay a fresh TCP + TLS handshake
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "300"))
+
+# Pooled HTTP/2 client reused by every OpenAI and Tavily call; concurrent requests
+# to the same host are multiplexed as streams over one connection
+http_client = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(
+        max_connections=100,
+        max_keepalive_connections=50,
+        keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+    ),
+    timeout=30
+)
+
+openai_client = AsyncOpenAI(
+    api_key=os.getenv("OPENAI_API_KEY"),
+    http_client=http_client,
+    timeout=30,
+    # Retries are handled below with jittered backoff
+    max_retries=0
+)
+
+# Throttling budget; sized to the account's rate limits
+MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "16"))
+REQUESTS_PER_MINUTE = int(os.getenv("OPENAI_RPM", "500"))
+TOKENS_PER_MINUTE = int(os.getenv("OPENAI_TPM", "200000"))
+
+class TokenBucket:
+    """Token bucket that refills continuously up to one minute's budget."""
+    
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.refill_rate = per_minute / 60
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self, tokens: float = 1) -> None:
+        """Wait until the requested tokens are available, then take them."""
+        tokens = min(tokens, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_rate)
+                self.updated_at = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self.tokens) / self.refill_rate)
+
+# Shared by every session in the process, so the total load on OpenAI stays bounded
+OPENAI_SEM = asyncio.Semaphore(MAX_CONCURRENCY)
+request_bucket = TokenBucket(REQUESTS_PER_MINUTE)
+token_bucket = TokenBucket(TOKENS_PER_MINUTE)
+
+# Transient failures worth retrying with exponential backoff and jitter
+RETRY_ATTEMPTS = int(os.getenv("API_RETRY_ATTEMPTS", "5"))
+OPENAI_RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError
+)
+
+def _is_retryable_tavily_error(error: BaseException) -> bool:
+    """Timeouts, connection errors, rate limiting and server errors are transient."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code == 429 or error.response.status_code >= 500
+    return isinstance(error, httpx.TransportError)
+
+def estimate_tokens(messages: List[Dict[str, str]], max_tokens: int = 0) -> int:
+    """Rough token estimate (~4 characters per token) for the prompt plus completion budget."""
+    return sum(len(message["content"]) for message in messages) // 4 + max_tokens
+
+@retry(
+    stop=stop_after_attempt(RETRY_ATTEMPTS),
+    wait=wait_random_exponential(min=1, max=30),
+    retry=retry_if_exception_type(OPENAI_RETRYABLE_ERRORS),
+    reraise=True
+)
+async def create_chat_completion(**kwargs: Any):
+    """
+    Create a chat completion through the shared client, bounded by the
+    concurrency semaphore and throttled to the request and token budgets.
+    Transient errors are retried; each attempt waits for a fresh slot.
+    """
+    async with OPENAI_SEM:
+        await request_bucket.acquire()
+        await token_bucket.acquire(estimate_tokens(kwargs["messages"], kwargs.get("max_tokens") or 0))
+        return await openai_client.chat.completions.create(**kwargs)
+
+@retry(
+    stop=stop_after_attempt(RETRY_ATTEMPTS),
+    wait=wait_random_exponential(min=1, max=30),
+    retry=retry_if_exception_type(OPENAI_RETRYABLE_ERRORS),
+    reraise=True
+)
+async def create_embedding(**kwargs: Any):
+    """
+    Create an embedding through the shared client, under the same concurrency
+    semaphore and request and token budgets as chat completions.
+    """
+    async with OPENAI_SEM:
+        await request_bucket.acquire()
+        await token_bucket.acquire(len(kwargs["input"]) // 4 + 1)
+        return await openai_client.embeddings.create(**kwargs)
+
+TAVILY_BASE_URL = "https://api.tavily.com"
+TAVILY_MAX_CONCURRENCY = int(os.getenv("TAVILY_MAX_CONCURRENCY", "5"))
+TAVILY_RPM = int(os.getenv("TAVILY_RPM", "1000"))
+
+TAVILY_SEM = asyncio.Semaphore(TAVILY_MAX_CONCURRENCY)
+tavily_bucket = TokenBucket(TAVILY_RPM)
+
+class TavilySearchClient:
+    """
+    Minimal async Tavily search client on the shared connection pool.
+    The SDK's AsyncTavilyClient opens and closes a new HTTP client on every call.
+    """
+    
+    def __init__(self, api_key: Optional[str]):
+        if not api_key:
+            logger.warning("Tavily API key not found in environment variables")
+        self._headers = {"Authorization": f"Bearer {api_key}"}
+    
+    @retry(
+        stop=stop_after_attempt(RETRY_ATTEMPTS),
+        wait=wait_random_exponential(min=1, max=30),
+        retry=retry_if_exception(_is_retryable_tavily_error),
+        reraise=True
+    )
+    async def search(self, query: str, timeout: int = 60, **params: Any) -> Dict[str, Any]:
+        """
+        POST a search to Tavily and return the decoded response; raises on HTTP errors.
+        Searches share a process-wide concurrency limit and request budget.
+        """
+        async with TAVILY_SEM:
+            await tavily_bucket.acquire()
+            response = await http_client.post(
+                f"{TAVILY_BASE_URL}/search",
+                json={"query": query, **params},
+                headers=self._headers,
+                timeout=timeout
+            )
+        response.raise_for_status()
+        return response.json()
+
+tavily_client = TavilySearchClient(os.getenv("TAVILY_API_KEY"))
+
+# Seconds between keep-alive pings that stop the pooled connections from going cold
+KEEPALIVE_INTERVAL = int(os.getenv("OPENAI_KEEPALIVE_INTERVAL", "240"))
+# Upper bound on a round of warm-up pings; warming is only an optimization
+WARMUP_TIMEOUT = float(os.getenv("WARMUP_TIMEOUT", "5"))
+
+_keepalive_task: Optional[asyncio.Task] = None
+
+async def _ping_openai() -> None:
+    try:
+        await openai_client.models.list()
+    except Exception as e:
+        logger.warning("OpenAI warm-up request failed: %s", e)
+
+async def _ping_tavily() -> None:
+    # Any response will do; the point is the open connection
+    try:
+        await http_client.head(TAVILY_BASE_URL)
+    except Exception as e:
+        logger.warning("Tavily warm-up request failed: %s", e)
+
+async def _ping() -> None:
+    """Make cheap requests to open (or keep open) a pooled connection to each API."""
+    try:
+        await asyncio.wait_for(asyncio.gather(_ping_openai(), _ping_tavily()), timeout=WARMUP_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning("Warm-up requests timed out after %ss", WARMUP_TIMEOUT)
+
+async def _keepalive() -> None:
+    await _ping()
+    logger.info("🔥 Shared API clients warmed up")
+    while KEEPALIVE_INTERVAL > 0:
+        await asyncio.sleep(KEEPALIVE_INTERVAL)
+        await _ping()
+
+async def warm_clients():
+    """
+    Resolve DNS and complete the TLS handshake before the first user request; called on application startup.
+    The pings run in the background, so a slow or unreachable API never delays startup.
+    """
+    global _keepalive_task
+    if _keepalive_task is None:
+        _keepalive_task = asyncio.create_task(_keepalive())
+
+async def close_clients():
+    """Close the shared clients and their connection pool; called on application shutdown."""
+    global _keepalive_task
+    if _keepalive_task is not None:
+        _keepalive_task.cancel()
+        _keepalive_task = None
+    await openai_client.close()
+    await http_client.aclose()
+    logger.info("🔌 Shared API clients closed")
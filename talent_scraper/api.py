@@ -3,12 +3,17 @@ Talent Scraper API Module
 Contains the FastAPI routes for the talent scraping chatbot.
 """
 from fastapi import APIRouter, HTTPException, Request
-from pydantic import BaseModel
-from typing import List, Optional
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from contextlib import AsyncExitStack
+from typing import AsyncIterator, List, Optional
 import os
 import asyncio
 import logging
-from talent_scraper_chatbot import TalentScraperChatbot, ChatbotResponse
+import orjson
+from talent_scraper_chatbot import ChatbotResponse, NO_HISTORY_SUMMARY
+from .limiter import chat_limiter
+from .sessions import find_chat_session, get_chat_session, reset_chat_session
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -16,21 +21,21 @@ logger = logging.getLogger(__name__)
 # Create router for talent scraper
 router = APIRouter()
 
-# Initialize the chatbot
-chatbot = TalentScraperChatbot()
-
 # Pydantic models
 class ChatRequest(BaseModel):
-    message: str
-    session_id: Optional[str] = "default"
-    
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "message": "Find me 3 senior React developers with AI experience",
                 "session_id": "user123"
             }
         }
+    )
+    
+    message: str
+    session_id: Optional[str] = "default"
 
 class ChatResponse(BaseModel):
     response: str
@@ -40,39 +45,68 @@ class ChatResponse(BaseModel):
     conversation_context: Optional[str] = None
     session_id: str
 
-# API Endpoints
-@router.post("/chat", response_model=ChatResponse)
-async def chat_with_bot(request: ChatRequest):
-    """
-    Chat with the talent scraper bot.
-    
-    The bot can:
-    - Understand natural language talent requests
-    - Search for candidates using Tavily
-    - Provide detailed candidate analysis
-    - Engage in general conversation about talent needs
-    """
+# Built once so responses are serialized by pydantic-core without re-validation
+_CHAT_RESPONSE_ADAPTER = TypeAdapter(ChatResponse)
+
+def _sse_event(data: str) -> bytes:
+    """Format a piece of text as a Server-Sent Event; the text is JSON-encoded so newlines survive."""
+    return b"data: " + orjson.dumps(data) + b"\n\n"
+
+async def _stream_chat_events(bot_response: ChatbotResponse, session_id: str) -> AsyncIterator[bytes]:
+    """Forward reply deltas as they arrive, then the complete response as a "result" event."""
     try:
-        logger.info(f"💬 Chat request from {request.session_id}: {request.message}")
-        
-        # Process the chat message
-        bot_response = await chatbot.chat(request.message)
+        parts = []
+        if bot_response.stream is None:
+            parts.append(bot_response.message)
+            yield _sse_event(bot_response.message)
+        else:
+            async for delta in bot_response.stream:
+                parts.append(delta)
+                yield _sse_event(delta)
         
-        # Build API response
         response = ChatResponse(
-            response=bot_response.message,
+            response="".join(parts),
             search_performed=bot_response.search_performed,
             talent_count=len(bot_response.talent_results) if bot_response.talent_results else None,
             search_summary=bot_response.search_summary,
             conversation_context=bot_response.conversation_context,
-            session_id=request.session_id
+            session_id=session_id
         )
-        
-        logger.info(f"✅ Chat response generated for {request.session_id}")
-        return response
-        
+        yield b"event: result\ndata: " + _CHAT_RESPONSE_ADAPTER.dump_json(response) + b"\n\n"
+        yield b"data: [DONE]\n\n"
+    except Exception as e:
+        logger.error("❌ Chat stream error: %s", e)
+        yield b"data: [DONE]\n\n"
+
+class _ChatStreamResponse(StreamingResponse):
+    """
+    Streaming response that holds the limiter slot and session lock until it is done.
+    They are released when the response finishes, however it finishes: a client that
+    disconnects before the body is iterated still frees them.
+    """
+    
+    def __init__(self, content: AsyncIterator[bytes], resources: AsyncExitStack, **kwargs):
+        super().__init__(content, **kwargs)
+        self.resources = resources
+    
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await self.body_iterator.aclose()
+            await self.resources.aclose()
+
+async def stream_chat(request: ChatRequest) -> StreamingResponse:
+    """Run a chat turn and stream its reply as Server-Sent Events."""
+    resources = AsyncExitStack()
+    await resources.enter_async_context(chat_limiter)
+    try:
+        chatbot, session_lock = get_chat_session(request.session_id)
+        await resources.enter_async_context(session_lock)
+        bot_response = await chatbot.chat(request.message, stream=True)
     except Exception as e:
-        logger.error(f"❌ Chat error: {str(e)}")
+        await resources.aclose()
+        logger.error("❌ Chat error: %s", e)
         raise HTTPException(
             status_code=500,
             detail={
@@ -81,12 +115,67 @@ async def chat_with_bot(request: ChatRequest):
                 "session_id": request.session_id
             }
         )
+    
+    return _ChatStreamResponse(
+        _stream_chat_events(bot_response, request.session_id),
+        resources,
+        media_type="text/event-stream"
+    )
+
+# API Endpoints
+@router.post("/chat", response_model=ChatResponse)
+async def chat_with_bot(request: ChatRequest, stream: bool = False):
+    """
+    Chat with the talent scraper bot.
+    With ?stream=true the reply is sent as Server-Sent Events while it is generated.
+    
+    The bot can:
+    - Understand natural language talent requests
+    - Search for candidates using Tavily
+    - Provide detailed candidate analysis
+    - Engage in general conversation about talent needs
+    """
+    if stream:
+        return await stream_chat(request)
+    
+    async with chat_limiter:
+        try:
+            logger.info("💬 Chat request from %s: %s", request.session_id, request.message)
+            
+            # Process the chat message; only turns within the same session are serialized
+            chatbot, session_lock = get_chat_session(request.session_id)
+            async with session_lock:
+                bot_response = await chatbot.chat(request.message)
+            
+            # Build API response
+            response = ChatResponse(
+                response=bot_response.message,
+                search_performed=bot_response.search_performed,
+                talent_count=len(bot_response.talent_results) if bot_response.talent_results else None,
+                search_summary=bot_response.search_summary,
+                conversation_context=bot_response.conversation_context,
+                session_id=request.session_id
+            )
+            
+            logger.info("✅ Chat response generated for %s", request.session_id)
+            return ORJSONResponse(content=_CHAT_RESPONSE_ADAPTER.dump_python(response, mode="json"))
+            
+        except Exception as e:
+            logger.error("❌ Chat error: %s", e)
+            raise HTTPException(
+                status_code=500,
+                detail={
+                    "error": "Internal server error",
+                    "message": str(e),
+                    "session_id": request.session_id
+                }
+            )
 
 @router.post("/reset-conversation")
 async def reset_conversation(session_id: str = "default"):
     """Reset conversation history for a session."""
     try:
-        chatbot.reset_conversation()
+        reset_chat_session(session_id)
         return {
             "success": True,
             "message": "Conversation history reset successfully",
@@ -96,26 +185,23 @@ async def reset_conversation(session_id: str = "default"):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/conversation-summary")
-async def get_conversation_summary():
-    """Get current conversation summary."""
+async def get_conversation_summary(session_id: str = "default"):
+    """Get current conversation summary for a session."""
+    session = find_chat_session(session_id)
+    if session is None:
+        # Reading the summary of an unknown session must not create one
+        return {"success": True, "summary": NO_HISTORY_SUMMARY, "conversation_length": 0}
+    chatbot, _ = session
     try:
         summary = chatbot.get_conversation_summary()
         return {
             "success": True,
-            "summary": summary
+            "summary": summary,
+            "conversation_length": len(chatbot.conversation_history)
         }
     except Exception as e:
-        logger.error(f"Error getting conversation summary: {str(e)}")
+        logger.error("Error getting conversation summary: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to generate conversation summary: {str(e)}"
         )
-    try:
-        summary = chatbot.get_conversation_summary()
-        return {
-            "success": True,
-            "summary": summary,
-            "conversation_length": len(chatbot.conversation_history)
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,39 @@
+"""
+Limiter module for the Talent Scraper.
+Caps the number of in-flight chat requests per worker so a burst of slow
+searches cannot starve the rest of the server.
+"""
+import os
+import asyncio
+import logging
+from fastapi import HTTPException
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# In-flight chat requests allowed per worker process
+CONCURRENT_REQUEST_PER_WORKER = int(os.getenv("CONCURRENT_REQUEST_PER_WORKER", "8"))
+
+class RequestLimiter:
+    """Async context manager that rejects requests with 503 once the limit is reached."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.count = 0
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        async with self._lock:
+            if self.count >= self.limit:
+                logger.warning("🚦 Rejecting request, %s chats already in flight", self.count)
+                raise HTTPException(status_code=503, detail="server busy")
+            self.count += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        async with self._lock:
+            self.count -= 1
+        return False
+
+# Shared limiter for the chat endpoints
+chat_limiter = RequestLimiter(CONCURRENT_REQUEST_PER_WORKER)
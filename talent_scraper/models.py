@@ -14,7 +14,7 @@ class SeniorityLevel(str, Enum):
     LEAD = "Lead"
     PRINCIPAL = "Principal"
 
-@dataclass
+@dataclass(slots=True)
 class Talent:
     """Represents a talent profile."""
     title: str
@@ -28,8 +28,9 @@ class Talent:
     risk_score: Optional[int] = None
     strengths: Optional[List[str]] = None
     summary: Optional[str] = None
+    match_score: Optional[float] = None  # Set while ranking; lower is better
 
-@dataclass
+@dataclass(slots=True)
 class ChatbotResponse:
     """Response from the talent scraper chatbot."""
     message: str
@@ -0,0 +1,34 @@
+"""
+Sessions module for the Talent Scraper.
+Keeps one chatbot (and its conversation history) per session id.
+"""
+import os
+import asyncio
+from typing import Optional, Tuple
+from cachetools import TTLCache
+from talent_scraper_chatbot import TalentScraperChatbot
+
+# Upper bound on live sessions and how long an idle session is kept (seconds)
+MAX_CHAT_SESSIONS = int(os.getenv("MAX_CHAT_SESSIONS", "1000"))
+SESSION_IDLE_TTL = int(os.getenv("SESSION_IDLE_TTL", "1800"))
+
+# Per-session chatbots and their locks. The size bound evicts the least recently used
+# session and the TTL drops sessions that have been idle for SESSION_IDLE_TTL seconds.
+chat_sessions: TTLCache = TTLCache(maxsize=MAX_CHAT_SESSIONS, ttl=SESSION_IDLE_TTL)
+
+def get_chat_session(session_id: str) -> Tuple[TalentScraperChatbot, asyncio.Lock]:
+    """Return the chatbot and lock for a session, creating them on first use."""
+    session = chat_sessions.pop(session_id, None)
+    if session is None:
+        session = (TalentScraperChatbot(), asyncio.Lock())
+    # Re-inserting restarts the idle timer
+    chat_sessions[session_id] = session
+    return session
+
+def find_chat_session(session_id: str) -> Optional[Tuple[TalentScraperChatbot, asyncio.Lock]]:
+    """Return an existing session without creating one or restarting its idle timer."""
+    return chat_sessions.get(session_id)
+
+def reset_chat_session(session_id: str) -> None:
+    """Drop a session so its next message starts a fresh conversation."""
+    chat_sessions.pop(session_id, None)
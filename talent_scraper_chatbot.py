@@ -1,26 +1,140 @@
 import os
 import json
+import hashlib
 import asyncio
 import re
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from typing import AsyncIterator, List, Dict, Any, Literal, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from pydantic import BaseModel, ConfigDict, field_validator
 from dotenv import load_dotenv
-from tavily import TavilyClient
 import logging
 import openai
-from openai import AsyncOpenAI
+from cachetools import LRUCache, TTLCache
+from llm_client import create_chat_completion, estimate_tokens, tavily_client
 
 # Load environment variables
 load_dotenv()
 
 # Setup logging
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
 logger = logging.getLogger(__name__)
 
-# Initialize clients
-tavily_client = TavilyClient(api_key=os.getenv("TAVILY_API_KEY"))
-openai_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# Models for intent analysis (JSON extraction) and result formatting
+INTENT_MODEL = os.getenv("INTENT_MODEL", "gpt-4o-mini")
+FORMAT_MODEL = os.getenv("FORMAT_MODEL", "gpt-4o-mini")
+
+# Conversation history bounds: once it grows past the trigger, everything but the
+# most recent messages is folded into a short running summary
+HISTORY_SUMMARY_TRIGGER = 20
+HISTORY_KEEP_RECENT = 10
+# Token budget for the recent messages sent with each prompt; the newest message is always kept
+MAX_CTX_TOKENS = int(os.getenv("MAX_CTX_TOKENS", "2000"))
+SUMMARY_MODEL = "gpt-4o-mini"
+SUMMARY_MAX_TOKENS = 200
+
+# Summaries keyed by a hash of their input, so identical histories are not summarized twice
+_summary_cache: LRUCache = LRUCache(maxsize=256)
+
+# Formatted search-result replies, keyed by the requirements plus the candidate set
+# (order-insensitive), so a repeated search does not pay for another GPT-4 formatting call
+RESULTS_RESPONSE_TTL = int(os.getenv("RESULTS_RESPONSE_TTL", "3600"))
+_results_response_cache: TTLCache = TTLCache(maxsize=256, ttl=RESULTS_RESPONSE_TTL)
+
+def _results_cache_key(results_data: List[Dict[str, Any]], search_intent: Dict[str, Any]) -> str:
+    """Hash the requested skills, quantity and seniority together with the sorted candidate data."""
+    payload = json.dumps({
+        "skills": sorted(skill.lower() for skill in search_intent.get("skills") or []),
+        "quantity": search_intent.get("quantity"),
+        "seniority": search_intent.get("seniority"),
+        "results": sorted(json.dumps(result, sort_keys=True) for result in results_data)
+    }, sort_keys=True)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+# Ranked candidates per canonical search (skills, seniority, quantity); kept for an hour
+# since candidate availability changes
+TALENT_RESULTS_TTL = int(os.getenv("TALENT_RESULTS_TTL", "3600"))
+_talent_results_cache: TTLCache = TTLCache(maxsize=256, ttl=TALENT_RESULTS_TTL)
+
+def _talent_results_key(requirements: Dict[str, Any]) -> Tuple[Tuple[str, ...], str, int]:
+    """Canonical search key, independent of how the request was worded."""
+    return (
+        tuple(sorted(skill.lower() for skill in requirements["skills"])),
+        requirements["seniority"].value,
+        requirements["quantity"]
+    )
+
+# Summary of a session with no messages yet
+NO_HISTORY_SUMMARY = "No conversation history yet."
+
+NO_RESULTS_MESSAGE = "🚫 I couldn't find any candidates matching your exact criteria. Would you like me to try a broader search or adjust the requirements?"
+
+# Skills detected in search results, in the order they are reported
+SKILL_PATTERNS = (
+    'React', 'Node.js', 'Python', 'JavaScript', 'MongoDB', 'Express',
+    'AI', 'Machine Learning', 'DevOps', 'AWS', 'Docker', 'TypeScript',
+    'Full Stack', 'Frontend', 'Backend', 'Mobile', 'Flutter'
+)
+# One pass over the text finds every skill; the lookahead keeps overlapping matches
+# ("Express" inside "ExpressJS", "AI" inside other words) just like a substring test
+SKILL_RE = re.compile("(?=(" + "|".join(re.escape(skill) for skill in SKILL_PATTERNS) + "))", re.IGNORECASE)
+SKILL_PATTERNS_LOWER = tuple((skill, skill.lower()) for skill in SKILL_PATTERNS)
+
+# Request keywords and the skills each one implies
+TECH_KEYWORDS = {
+    "react": ["React", "ReactJS", "Frontend"],
+    "node": ["Node.js", "NodeJS", "Backend"],
+    "python": ["Python", "Django", "Flask"],
+    "javascript": ["JavaScript", "JS", "Frontend"],
+    "mongodb": ["MongoDB", "NoSQL", "Database"],
+    "express": ["Express.js", "ExpressJS"],
+    "ai": ["AI", "Machine Learning", "Deep Learning"],
+    "fullstack": ["Full Stack", "Full-Stack", "Fullstack"],
+    "mern": ["MERN", "MongoDB", "Express", "React", "Node"],
+    "devops": ["DevOps", "AWS", "Docker", "Kubernetes"],
+    "mobile": ["React Native", "Flutter", "iOS", "Android"]
+}
+# Matches keywords as plain substrings, like SKILL_RE, over lowercased input
+TECH_KEYWORDS_RE = re.compile("(?=(" + "|".join(re.escape(key) for key in TECH_KEYWORDS) + "))")
+
+def normalize_url(url: str) -> str:
+    """Canonical form of a result URL: no tracking parameters, fragment or trailing slash."""
+    parts = urlsplit(url.strip())
+    query = urlencode([(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+                       if not key.lower().startswith('utm_')])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), query, ''))
+
+# Threads that parse search results into profiles, off the event loop
+EXTRACTION_WORKERS = int(os.getenv("EXTRACTION_WORKERS", str(min(16, (os.cpu_count() or 4) * 2))))
+_extraction_pool = ThreadPoolExecutor(max_workers=EXTRACTION_WORKERS, thread_name_prefix="extract")
+
+# Profile field patterns
+NAME_RE = re.compile(r'^([A-Za-z\s]+?)(?:\s*[-–|]|\s*\d|\s*$)')
+EXP_RE = re.compile(r'(\d+)\+?\s*years?\s*(?:of\s*)?(?:experience|exp)')
+RATING_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(?:stars?|rating|\/5)')
+RATE_RE = re.compile(r'\$(\d+)(?:\.\d+)?\/(?:hour|hr)')
+
+# Local intent classification. Clear-cut messages are classified with these patterns;
+# only ambiguous ones are sent to the LLM.
+TALENT_ROLES = r'(?:developers?|engineers?|programmers?|freelancers?|talent|candidates?|experts?|consultants?|devs?)'
+TALENT_ROLE_RE = re.compile(r'\b' + TALENT_ROLES + r'\b', re.IGNORECASE)
+TALENT_ACTION_RE = re.compile(r'\b(?:find|search|need|hire|hiring|recruit|looking for|source)\b', re.IGNORECASE)
+# Whole-word skills only, so "AI" does not match inside "again" or "available"
+INTENT_SKILL_RE = re.compile(r'(?<!\w)(' + "|".join(re.escape(skill) for skill in SKILL_PATTERNS) + r')(?!\w)', re.IGNORECASE)
+SENIORITY_RE = re.compile(r'\b(junior|mid|senior|lead|principal)\b', re.IGNORECASE)
+# A number counts as a quantity only when a role noun follows it ("3 senior React developers"),
+# not in "10 years of experience"
+QUANTITY_RE = re.compile(
+    r'\b(\d+)\s+(?:(?!years?\b|yrs?\b|months?\b)[A-Za-z.+#-]+\s+){0,3}?' + TALENT_ROLES + r'\b',
+    re.IGNORECASE
+)
+PLATFORM_RE = re.compile(r'\b(upwork|linkedin|github)\b', re.IGNORECASE)
+URGENCY_RE = re.compile(r'\b(?:urgent|urgently|asap|immediately)\b', re.IGNORECASE)
+
+# First number in a request, taken as the number of candidates wanted
+NUMBER_RE = re.compile(r'(\d+)')
 
 # Data Models
 class SeniorityLevel(str, Enum):
@@ -30,7 +144,19 @@ class SeniorityLevel(str, Enum):
     LEAD = "Lead"
     PRINCIPAL = "Principal"
 
-@dataclass
+# Request keywords and the seniority they imply; the first match in this order wins
+SENIORITY_MAP = {
+    "junior": SeniorityLevel.JUNIOR,
+    "mid": SeniorityLevel.MID,
+    "senior": SeniorityLevel.SENIOR,
+    "lead": SeniorityLevel.LEAD,
+    "principal": SeniorityLevel.PRINCIPAL,
+    "entry": SeniorityLevel.JUNIOR,
+    "experienced": SeniorityLevel.SENIOR,
+    "expert": SeniorityLevel.SENIOR
+}
+
+@dataclass(slots=True)
 class Talent:
     """Represents a talent profile."""
     title: str
@@ -44,8 +170,9 @@ class Talent:
     risk_score: Optional[int] = None
     strengths: Optional[List[str]] = None
     summary: Optional[str] = None
+    match_score: Optional[float] = None  # Set while ranking; lower is better
 
-@dataclass
+@dataclass(slots=True)
 class ChatbotResponse:
     """Response from the talent scraper chatbot."""
     message: str
@@ -53,6 +180,54 @@ class ChatbotResponse:
     search_performed: bool = False
     search_summary: Optional[str] = None
     conversation_context: Optional[str] = None
+    # Set instead of a complete message when the reply is streamed; yields text deltas
+    stream: Optional[AsyncIterator[str]] = None
+
+class IntentSchema(BaseModel):
+    """Search intent returned by the intent-analysis call."""
+    model_config = ConfigDict(extra="ignore")
+    
+    is_talent_request: bool = False
+    skills: List[str] = []
+    seniority: Optional[Literal["junior", "mid", "senior", "lead", "principal"]] = None
+    quantity: Optional[int] = None
+    platform_preference: Optional[str] = None
+    urgency: str = "medium"
+    additional_requirements: Optional[str] = ""
+    reply: Optional[str] = None
+    
+    @field_validator("seniority", "platform_preference", mode="before")
+    @classmethod
+    def _normalize(cls, value: Any) -> Any:
+        # The model sometimes capitalizes these or spells out "null"
+        if isinstance(value, str):
+            value = value.strip().lower()
+            return None if value in ("", "null", "none", "any") else value
+        return value
+
+INTENT_PROMPT = """
+Analyze this message to determine if the user is requesting talent/developer search:
+
+Message: "{message}"
+
+Return JSON with:
+{{
+    "is_talent_request": true/false,
+    "skills": ["list of technical skills mentioned"],
+    "seniority": "junior/mid/senior/lead/principal or null",
+    "quantity": number or null,
+    "platform_preference": "upwork/linkedin/github/any or null",
+    "urgency": "high/medium/low",
+    "additional_requirements": "any other specific requirements",
+    "reply": "if this is NOT a talent request, your full conversational reply to the user; otherwise null"
+}}
+
+Examples of talent requests:
+- "Find me 3 React developers"
+- "I need senior Python engineers with ML experience"
+- "Search for MERN stack freelancers"
+- "Can you help me find DevOps experts?"
+"""
 
 class TalentScraperChatbot:
     """AI-powered talent scraper chatbot using OpenAI + Tavily."""
@@ -61,6 +236,7 @@ class TalentScraperChatbot:
         self.name = "Talent Scraper Assistant"
         self.description = "AI chatbot that finds and evaluates talent using Tavily web scraping"
         self.conversation_history = []
+        self.history_summary: Optional[str] = None
         self.system_prompt = self._build_system_prompt()
         self.search_platforms = [
             "site:upwork.com/freelancers",
@@ -97,8 +273,11 @@ Focus on understanding the user's specific needs and delivering high-quality tal
 If the user asks general questions or wants to chat, respond naturally but always guide the conversation toward talent-related topics when appropriate.
 """
 
-    async def chat(self, user_message: str) -> ChatbotResponse:
-        """Main chat interface - processes user message and returns response."""
+    async def chat(self, user_message: str, stream: bool = False) -> ChatbotResponse:
+        """
+        Main chat interface - processes user message and returns response.
+        With stream=True a talent search reply is returned as a stream of text deltas.
+        """
         
         try:
             logger.info(f"💬 User message: {user_message}")
@@ -109,12 +288,18 @@ If the user asks general questions or wants to chat, respond naturally but alway
                 "content": user_message
             })
             
+            # Keep the prompt bounded before any further OpenAI calls
+            await self._compact_history()
+            
             # Determine if this is a talent search request
             search_intent = await self._analyze_search_intent(user_message)
             
             if search_intent["is_talent_request"]:
                 # Perform talent search
-                return await self._handle_talent_search(user_message, search_intent)
+                return await self._handle_talent_search(user_message, search_intent, stream)
+            elif search_intent.get("reply"):
+                # The intent call already answered the message; no second round-trip
+                return self._general_chat_response(search_intent["reply"])
             else:
                 # Handle general conversation
                 return await self._handle_general_chat(user_message)
@@ -126,44 +311,62 @@ If the user asks general questions or wants to chat, respond naturally but alway
                 search_performed=False
             )
 
+    def _classify_intent_locally(self, message: str) -> Optional[Dict[str, Any]]:
+        """
+        Classify clear-cut messages without an LLM call.
+        Returns the intent, or None when the message is ambiguous and needs the LLM.
+        """
+        has_role = TALENT_ROLE_RE.search(message) is not None
+        has_action = TALENT_ACTION_RE.search(message) is not None
+        matched = {match.group(1).lower() for match in INTENT_SKILL_RE.finditer(message)}
+        skills = [skill for skill, skill_lower in SKILL_PATTERNS_LOWER if skill_lower in matched]
+        
+        # Only a hiring verb, a role and a named skill together are a clear search; anything
+        # less ("those engineers again", "my developers use Python at work") goes to the LLM
+        if has_action and has_role and skills:
+            is_talent_request = True
+        elif not has_role and not has_action and not skills:
+            is_talent_request = False
+        else:
+            return None
+        
+        seniority_match = SENIORITY_RE.search(message)
+        quantity_match = QUANTITY_RE.search(message)
+        platform_match = PLATFORM_RE.search(message)
+        
+        return {
+            "is_talent_request": is_talent_request,
+            "skills": skills,
+            "seniority": seniority_match.group(1).lower() if seniority_match else None,
+            "quantity": int(quantity_match.group(1)) if quantity_match else None,
+            "platform_preference": platform_match.group(1).lower() if platform_match else None,
+            "urgency": "high" if URGENCY_RE.search(message) else "medium",
+            "additional_requirements": ""
+        }
+
     async def _analyze_search_intent(self, message: str) -> Dict[str, Any]:
         """Analyze if the user message is requesting talent search."""
         
-        intent_prompt = f"""
-Analyze this message to determine if the user is requesting talent/developer search:
-
-Message: "{message}"
-
-Return JSON with:
-{{
-    "is_talent_request": true/false,
-    "skills": ["list of technical skills mentioned"],
-    "seniority": "junior/mid/senior/lead/principal or null",
-    "quantity": number or null,
-    "platform_preference": "upwork/linkedin/github/any or null",
-    "urgency": "high/medium/low",
-    "additional_requirements": "any other specific requirements"
-}}
-
-Examples of talent requests:
-- "Find me 3 React developers"
-- "I need senior Python engineers with ML experience"
-- "Search for MERN stack freelancers"
-- "Can you help me find DevOps experts?"
-"""
-
+        # Most messages are clear-cut; skip the LLM round-trip for those
+        intent_data = self._classify_intent_locally(message)
+        if intent_data is not None:
+            logger.info(f"🧠 Search intent classified locally: {intent_data}")
+            return intent_data
+        
         try:
-            response = await openai_client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are an expert at analyzing user intent for talent search. Always respond with valid JSON."},
-                    {"role": "user", "content": intent_prompt}
-                ],
-                temperature=0.3,
-                max_tokens=500
+            response = await create_chat_completion(
+                model=INTENT_MODEL,
+                # The conversation context lets the same call answer non-talent messages directly
+                messages=self._build_chat_messages(
+                    "You are also an expert at analyzing user intent for talent search. Always respond with valid JSON."
+                ) + [{"role": "user", "content": INTENT_PROMPT.format(message=message)}],
+                temperature=0,
+                max_tokens=1000,
+                response_format={"type": "json_object"}
             )
             
-            intent_data = json.loads(response.choices[0].message.content)
+            # Validate against the schema; malformed output falls through to keyword detection
+            intent_data = IntentSchema.model_validate_json(response.choices[0].message.content).model_dump()
             logger.info(f"🧠 Search intent analyzed: {intent_data}")
             return intent_data
             
@@ -183,7 +386,8 @@ Examples of talent requests:
                 "additional_requirements": ""
             }
 
-    async def _handle_talent_search(self, user_message: str, search_intent: Dict[str, Any]) -> ChatbotResponse:
+    async def _handle_talent_search(self, user_message: str, search_intent: Dict[str, Any],
+                                    stream: bool = False) -> ChatbotResponse:
         """Handle talent search requests."""
         
         # Generate search acknowledgment
@@ -192,6 +396,17 @@ Examples of talent requests:
         # Perform the actual talent search using Tavily
         talent_results = await self._search_talent_with_tavily(user_message, search_intent)
         
+        if stream:
+            # The formatted reply is recorded in the history once the stream is consumed
+            return ChatbotResponse(
+                message="",
+                talent_results=talent_results,
+                search_performed=True,
+                search_summary=f"Found {len(talent_results)} candidates matching your criteria",
+                conversation_context="talent_search_completed",
+                stream=self._stream_results_response(talent_results, search_intent)
+            )
+        
         # Generate final response with results
         final_response = await self._generate_results_response(talent_results, search_intent)
         
@@ -209,35 +424,53 @@ Examples of talent requests:
             conversation_context="talent_search_completed"
         )
 
+    def _build_chat_messages(self, extra_instructions: Optional[str] = None) -> List[Dict[str, str]]:
+        """System prompt, running summary and the most recent turns, ready for OpenAI."""
+        system_prompt = f"{self.system_prompt}\n{extra_instructions}" if extra_instructions else self.system_prompt
+        messages = [
+            {"role": "system", "content": system_prompt}
+        ]
+        if self.history_summary:
+            messages.append({"role": "system", "content": f"Summary of the earlier conversation: {self.history_summary}"})
+        return messages + self._recent_history()
+
+    def _recent_history(self) -> List[Dict[str, str]]:
+        """The most recent messages that fit in MAX_CTX_TOKENS, oldest first."""
+        recent = []
+        budget = MAX_CTX_TOKENS
+        for message in reversed(self.conversation_history[-HISTORY_KEEP_RECENT:]):
+            budget -= estimate_tokens([message])
+            if budget < 0 and recent:
+                break
+            recent.append(message)
+        recent.reverse()
+        return recent
+
+    def _general_chat_response(self, ai_response: str) -> ChatbotResponse:
+        """Record a general-chat reply in the history and wrap it in a response."""
+        self.conversation_history.append({
+            "role": "assistant",
+            "content": ai_response
+        })
+        
+        return ChatbotResponse(
+            message=ai_response,
+            search_performed=False,
+            conversation_context="general_chat"
+        )
+
     async def _handle_general_chat(self, user_message: str) -> ChatbotResponse:
         """Handle general conversation."""
         
-        # Prepare conversation for OpenAI
-        messages = [
-            {"role": "system", "content": self.system_prompt}
-        ] + self.conversation_history[-10:]  # Keep last 10 messages for context
-        
         try:
-            response = await openai_client.chat.completions.create(
+            response = await create_chat_completion(
                 model="gpt-4",
-                messages=messages,
+                messages=self._build_chat_messages(),
                 temperature=0.7,
                 max_tokens=800
             )
             
-            ai_response = response.choices[0].message.content
-            
-            # Add to conversation history
-            self.conversation_history.append({
-                "role": "assistant",
-                "content": ai_response
-            })
-            
-            return ChatbotResponse(
-                message=ai_response,
-                search_performed=False,
-                conversation_context="general_chat"
-            )
+            return self._general_chat_response(response.choices[0].message.content)
             
         except Exception as e:
             logger.error(f"❌ General chat error: {str(e)}")
@@ -280,6 +513,14 @@ Examples of talent requests:
             # Step 1: Decompose requirements
             requirements = await self._decompose_requirements(user_message)
             
+            # The searches depend only on these fields, so differently worded requests
+            # for the same skills, seniority and quantity share one Tavily fan-out
+            cache_key = _talent_results_key(requirements)
+            cached_talent = _talent_results_cache.get(cache_key)
+            if cached_talent is not None:
+                logger.info("♻️ Using cached talent search results")
+                return list(cached_talent)
+            
             # Step 2: Generate search queries
             search_queries = self._generate_search_queries(requirements)
             
@@ -292,6 +533,9 @@ Examples of talent requests:
             # Step 5: Rank and filter
             final_talent_list = self._rank_and_filter_talent(talent_profiles, requirements)
             
+            # An empty list usually means the searches failed; let the next request retry
+            if final_talent_list:
+                _talent_results_cache[cache_key] = list(final_talent_list)
             return final_talent_list
             
         except Exception as e:
@@ -303,46 +547,19 @@ Examples of talent requests:
         
         user_lower = user_input.lower()
         
-        # Extract technologies/skills
-        tech_keywords = {
-            "react": ["React", "ReactJS", "Frontend"],
-            "node": ["Node.js", "NodeJS", "Backend"],
-            "python": ["Python", "Django", "Flask"],
-            "javascript": ["JavaScript", "JS", "Frontend"],
-            "mongodb": ["MongoDB", "NoSQL", "Database"],
-            "express": ["Express.js", "ExpressJS"],
-            "ai": ["AI", "Machine Learning", "Deep Learning"],
-            "fullstack": ["Full Stack", "Full-Stack", "Fullstack"],
-            "mern": ["MERN", "MongoDB", "Express", "React", "Node"],
-            "devops": ["DevOps", "AWS", "Docker", "Kubernetes"],
-            "mobile": ["React Native", "Flutter", "iOS", "Android"]
-        }
-        
-        # Extract seniority level
-        seniority_map = {
-            "junior": SeniorityLevel.JUNIOR,
-            "mid": SeniorityLevel.MID,
-            "senior": SeniorityLevel.SENIOR,
-            "lead": SeniorityLevel.LEAD,
-            "principal": SeniorityLevel.PRINCIPAL,
-            "entry": SeniorityLevel.JUNIOR,
-            "experienced": SeniorityLevel.SENIOR,
-            "expert": SeniorityLevel.SENIOR
-        }
-        
+        # Every keyword present anywhere in the request, found in a single scan
         extracted_skills = []
-        for key, skills in tech_keywords.items():
-            if key in user_lower:
-                extracted_skills.extend(skills)
+        for key in set(TECH_KEYWORDS_RE.findall(user_lower)):
+            extracted_skills.extend(TECH_KEYWORDS[key])
         
         extracted_seniority = SeniorityLevel.MID  # Default
-        for key, level in seniority_map.items():
+        for key, level in SENIORITY_MAP.items():
             if key in user_lower:
                 extracted_seniority = level
                 break
         
         # Extract quantity
-        quantity_match = re.search(r'(\d+)', user_input)
+        quantity_match = NUMBER_RE.search(user_input)
         quantity = int(quantity_match.group(1)) if quantity_match else 5
         
         requirements = {
@@ -388,84 +605,110 @@ Examples of talent requests:
         return queries[:5]  # Limit to 5 queries to avoid rate limits
 
     async def _execute_searches(self, search_queries: List[str]) -> List[Dict[str, Any]]:
-        """Execute searches using Tavily."""
+        """Execute searches using Tavily, all queries concurrently."""
         
-        all_results = []
+        # Concurrency and rate limits are enforced process-wide by the shared Tavily client
+        responses = await asyncio.gather(
+            *(self._search(query, i, len(search_queries)) for i, query in enumerate(search_queries, 1)),
+            return_exceptions=True
+        )
         
-        for i, query in enumerate(search_queries, 1):
-            try:
-                logger.info(f"🌐 Executing search {i}/{len(search_queries)}: {query}")
-                
-                response = tavily_client.search(
-                    query=query,
-                    search_depth="advanced",
-                    max_results=5,
-                    include_answer=True,
-                    include_raw_content=True
-                )
-                
-                results = response.get('results', [])
-                logger.info(f"📊 Found {len(results)} results for query {i}")
-                
-                # Add query context to each result
-                for result in results:
-                    result['search_query'] = query
-                    result['search_index'] = i
-                
-                all_results.extend(results)
-                
-                # Add delay to respect rate limits
-                await asyncio.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"❌ Search error for query '{query}': {str(e)}")
+        # Platform queries overlap, so the same profile often comes back more than once;
+        # keep one result per normalized URL (the one with the most content)
+        unique_results: Dict[str, Dict[str, Any]] = {}
+        all_results = []
+        for i, (query, response) in enumerate(zip(search_queries, responses), 1):
+            # One failed query should not drop the results of the others
+            if isinstance(response, Exception):
+                logger.error(f"❌ Search error for query '{query}': {str(response)}")
                 continue
-        
+            
+            results = response.get('results', [])
+            logger.info(f"📊 Found {len(results)} results for query {i}")
+            
+            # Add query context to each result
+            for result in results:
+                result['search_query'] = query
+                result['search_index'] = i
+                
+                url = result.get('url')
+                if not url:
+                    all_results.append(result)
+                    continue
+                key = normalize_url(url)
+                existing = unique_results.get(key)
+                if existing is None or len(result.get('content') or '') > len(existing.get('content') or ''):
+                    unique_results[key] = result
+        
+        all_results.extend(unique_results.values())
         logger.info(f"✅ Total search results collected: {len(all_results)}")
         return all_results
 
+    async def _search(self, query: str, index: int, total: int) -> Dict[str, Any]:
+        """Run one Tavily search."""
+        logger.info(f"🌐 Executing search {index}/{total}: {query}")
+        return await tavily_client.search(
+            query=query,
+            search_depth="advanced",
+            max_results=5,
+            include_answer=True,
+            include_raw_content=True
+        )
+
     async def _extract_talent_profiles(self, search_results: List[Dict[str, Any]]) -> List[Talent]:
         """Extract structured talent profiles from search results."""
         
-        talent_profiles = []
-        
-        for i, result in enumerate(search_results, 1):
-            try:
-                logger.info(f"🔍 Extracting profile {i}/{len(search_results)}")
-                
-                title = result.get('title', 'Unknown Developer')
-                url = result.get('url', '')
-                content = result.get('content', '')
-                
-                # Extract information using pattern matching
-                profile_data = self._extract_profile_data(title, content, url)
-                
-                # Create talent object
-                talent = Talent(
-                    title=profile_data.get('name', f"Developer {i}"),
-                    purpose=profile_data.get('role_description', "Software development professional"),
-                    seniority=profile_data.get('seniority', SeniorityLevel.MID),
-                    skill_keywords=profile_data.get('skills', []),
-                    profile_url=url,
-                    experience_years=profile_data.get('experience', 'Not specified'),
-                    rating=profile_data.get('rating', 'Not specified'),
-                    hourly_rate=profile_data.get('rate', 'Not specified'),
-                    risk_score=profile_data.get('risk_score', 3),
-                    strengths=profile_data.get('strengths', []),
-                    summary=content[:200] + "..." if len(content) > 200 else content
-                )
-                
-                talent_profiles.append(talent)
-                
-            except Exception as e:
-                logger.error(f"❌ Error extracting profile {i}: {str(e)}")
-                continue
+        # Parse all results in one hop off the event loop so other chats keep being served
+        # meanwhile; the regex work holds the GIL, so one task per result would only add overhead
+        loop = asyncio.get_running_loop()
+        talent_profiles = await loop.run_in_executor(_extraction_pool, self._build_talents, search_results)
         
         logger.info(f"✅ Extracted {len(talent_profiles)} talent profiles")
         return talent_profiles
 
-    def _extract_profile_data(self, title: str, content: str, url: str) -> Dict[str, Any]:
-        """Extract structured data from profile text."""
+    @staticmethod
+    def _build_talents(search_results: List[Dict[str, Any]]) -> List[Talent]:
+        """Build talent profiles from a batch of search results; runs in the extraction pool."""
+        total = len(search_results)
+        extracted = (TalentScraperChatbot._build_talent(i, total, result) for i, result in enumerate(search_results, 1))
+        return [talent for talent in extracted if talent is not None]
+
+    @staticmethod
+    def _build_talent(i: int, total: int, result: Dict[str, Any]) -> Optional[Talent]:
+        """Build a talent profile from one search result; runs in the extraction pool."""
+        try:
+            logger.info(f"🔍 Extracting profile {i}/{total}")
+            
+            title = result.get('title', 'Unknown Developer')
+            url = result.get('url', '')
+            content = result.get('content', '')
+            
+            # Extract information using pattern matching; lowercase once and share it
+            content_lower = content.lower()
+            profile_data = TalentScraperChatbot._extract_profile_data(title, content_lower, url)
+            
+            # Create talent object
+            return Talent(
+                title=profile_data.get('name', f"Developer {i}"),
+                purpose=profile_data.get('role_description', "Software development professional"),
+                seniority=profile_data.get('seniority', SeniorityLevel.MID),
+                skill_keywords=profile_data.get('skills', []),
+                profile_url=url,
+                experience_years=profile_data.get('experience', 'Not specified'),
+                rating=profile_data.get('rating', 'Not specified'),
+                hourly_rate=profile_data.get('rate', 'Not specified'),
+                risk_score=profile_data.get('risk_score', 3),
+                strengths=profile_data.get('strengths', []),
+                summary=f"{content[:200]}..." if len(content) > 200 else content
+            )
+            
+        except Exception as e:
+            logger.error(f"❌ Error extracting profile {i}: {str(e)}")
+            return None
+
+    @staticmethod
+    def _extract_profile_data(title: str, content_lower: str, url: str) -> Dict[str, Any]:
+        """Extract structured data from profile text; the content must already be lowercased."""
         
         profile_data = {
             'name': 'Unknown',
@@ -480,28 +723,20 @@ Examples of talent requests:
         }
         
         # Extract name (first part of title)
-        name_match = re.search(r'^([A-Za-z\s]+?)(?:\s*[-–|]|\s*\d|\s*$)', title)
+        name_match = NAME_RE.search(title)
         if name_match:
             profile_data['name'] = name_match.group(1).strip()
         
         # Extract skills
-        skill_patterns = [
-            'React', 'Node.js', 'Python', 'JavaScript', 'MongoDB', 'Express',
-            'AI', 'Machine Learning', 'DevOps', 'AWS', 'Docker', 'TypeScript',
-            'Full Stack', 'Frontend', 'Backend', 'Mobile', 'Flutter'
-        ]
-        
-        found_skills = []
-        text_to_search = (title + " " + content).lower()
-        
-        for skill in skill_patterns:
-            if skill.lower() in text_to_search:
-                found_skills.append(skill)
+        # Scan title and content separately rather than allocating a lowered concatenation
+        matched = {match.group(1).lower() for match in SKILL_RE.finditer(title)}
+        matched.update(match.group(1) for match in SKILL_RE.finditer(content_lower))
+        found_skills = [skill for skill, skill_lower in SKILL_PATTERNS_LOWER if skill_lower in matched]
         
         profile_data['skills'] = found_skills
         
         # Extract experience
-        exp_match = re.search(r'(\d+)\+?\s*years?\s*(?:of\s*)?(?:experience|exp)', content.lower())
+        exp_match = EXP_RE.search(content_lower)
         if exp_match:
             years = int(exp_match.group(1))
             profile_data['experience'] = f"{years} years"
@@ -517,12 +752,12 @@ Examples of talent requests:
                 profile_data['seniority'] = SeniorityLevel.LEAD
         
         # Extract rating
-        rating_match = re.search(r'(\d+(?:\.\d+)?)\s*(?:stars?|rating|\/5)', content.lower())
+        rating_match = RATING_RE.search(content_lower)
         if rating_match:
             profile_data['rating'] = f"{rating_match.group(1)}/5"
         
         # Extract hourly rate
-        rate_match = re.search(r'\$(\d+)(?:\.\d+)?\/(?:hour|hr)', content.lower())
+        rate_match = RATE_RE.search(content_lower)
         if rate_match:
             profile_data['rate'] = f"${rate_match.group(1)}/hour"
         
@@ -577,7 +812,7 @@ Examples of talent requests:
             talent.match_score = match_score
         
         # Sort by match score (lower is better)
-        sorted_talent = sorted(talent_profiles, key=lambda x: getattr(x, 'match_score', 5))
+        sorted_talent = sorted(talent_profiles, key=lambda x: x.match_score)
         
         # Return top candidates
         top_talent = sorted_talent[:target_quantity]
@@ -595,33 +830,112 @@ Examples of talent requests:
             summary="An error occurred during the talent hunting process."
         )
 
+    @staticmethod
+    def _talent_prompt_data(talent: Talent) -> Dict[str, Any]:
+        """The candidate fields the formatting prompt needs, without empty values."""
+        fields = {
+            "name": talent.title,
+            "skills": talent.skill_keywords,
+            "experience": talent.experience_years,
+            "rating": talent.rating,
+            "rate": talent.hourly_rate,
+            "risk_score": talent.risk_score,
+            "strengths": talent.strengths,
+            "summary": talent.summary
+        }
+        return {key: value for key, value in fields.items() if value not in (None, [], "")}
+
     async def _generate_results_response(self, talent_results: List[Talent], search_intent: Dict[str, Any]) -> str:
         """Generate a comprehensive response with talent search results."""
         
         if not talent_results:
-            return "🚫 I couldn't find any candidates matching your exact criteria. Would you like me to try a broader search or adjust the requirements?"
-        
-        # Prepare results for OpenAI to format
-        results_data = []
-        for talent in talent_results:
-            results_data.append({
-                "name": talent.title,
-                "skills": talent.skill_keywords,
-                "experience": talent.experience_years,
-                "rating": talent.rating,
-                "rate": talent.hourly_rate,
-                "risk_score": talent.risk_score,
-                "strengths": talent.strengths,
-                "summary": talent.summary
-            })
+            return NO_RESULTS_MESSAGE
+        
+        # Prepare results for OpenAI to format; empty fields are left out to save prompt tokens
+        results_data = [self._talent_prompt_data(talent) for talent in talent_results]
         
+        cache_key = _results_cache_key(results_data, search_intent)
+        cached_response = _results_response_cache.get(cache_key)
+        if cached_response:
+            logger.info("♻️ Using cached results response")
+            return cached_response
+        
+        try:
+            response = await create_chat_completion(
+                model=FORMAT_MODEL,
+                messages=self._results_format_messages(results_data),
+                temperature=0.7,
+                max_tokens=1500
+            )
+            
+            formatted_response = _results_response_cache[cache_key] = response.choices[0].message.content
+            return formatted_response
+            
+        except Exception as e:
+            logger.error(f"❌ Response formatting error: {str(e)}")
+            return self._fallback_results_response(talent_results)
+
+    async def _stream_results_response(self, talent_results: List[Talent], search_intent: Dict[str, Any]) -> AsyncIterator[str]:
+        """
+        Stream the formatted search results as they are generated.
+        The full reply is added to the conversation history once the stream ends.
+        """
+        parts = []
+        try:
+            if not talent_results:
+                parts.append(NO_RESULTS_MESSAGE)
+                yield NO_RESULTS_MESSAGE
+                return
+            
+            results_data = [self._talent_prompt_data(talent) for talent in talent_results]
+            cache_key = _results_cache_key(results_data, search_intent)
+            cached_response = _results_response_cache.get(cache_key)
+            if cached_response:
+                logger.info("♻️ Using cached results response")
+                parts.append(cached_response)
+                yield cached_response
+                return
+            
+            try:
+                response = await create_chat_completion(
+                    model=FORMAT_MODEL,
+                    messages=self._results_format_messages(results_data),
+                    temperature=0.7,
+                    max_tokens=1500,
+                    stream=True
+                )
+                async for chunk in response:
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if delta:
+                        parts.append(delta)
+                        yield delta
+            except Exception as e:
+                logger.error(f"❌ Response formatting error: {str(e)}")
+                # Only fall back if nothing was sent yet; a partial reply is kept as is
+                if not parts:
+                    fallback = self._fallback_results_response(talent_results)
+                    parts.append(fallback)
+                    yield fallback
+                return
+            
+            _results_response_cache[cache_key] = "".join(parts)
+        finally:
+            if parts:
+                self.conversation_history.append({
+                    "role": "assistant",
+                    "content": "".join(parts)
+                })
+
+    @staticmethod
+    def _results_format_messages(results_data: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+        """Prompt asking the formatting model to present the candidates."""
         format_prompt = f"""
 Format these talent search results into a professional, engaging response:
 
-Search Results: {json.dumps(results_data, indent=2)}
+Search Results: {json.dumps(results_data, separators=(',', ':'))}
 
 Requirements:
-- Start with a success message about finding {len(talent_results)} candidates
+- Start with a success message about finding {len(results_data)} candidates
 - Present each candidate clearly with key highlights
 - Include risk assessment and recommendations
 - End with an offer to help further or refine the search
@@ -630,46 +944,71 @@ Requirements:
 
 Make it informative and easy to read.
 """
+        return [
+            {"role": "system", "content": "You are a professional talent acquisition specialist. Format search results in an engaging, informative way."},
+            {"role": "user", "content": format_prompt}
+        ]
 
-        try:
-            response = await openai_client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a professional talent acquisition specialist. Format search results in an engaging, informative way."},
-                    {"role": "user", "content": format_prompt}
-                ],
-                temperature=0.7,
-                max_tokens=1500
-            )
-            
-            return response.choices[0].message.content
-            
-        except Exception as e:
-            logger.error(f"❌ Response formatting error: {str(e)}")
-            # Fallback to simple formatting
-            response_parts = [f"✅ Great! I found {len(talent_results)} talented candidates for you:\n"]
-            
-            for i, talent in enumerate(talent_results[:5], 1):
-                response_parts.append(f"\n{i}. **{talent.title}**")
-                response_parts.append(f"   💼 Skills: {', '.join(talent.skill_keywords[:5])}")
-                response_parts.append(f"   ⭐ Experience: {talent.experience_years}")
-                response_parts.append(f"   📊 Risk Score: {talent.risk_score}/5")
-                if talent.profile_url:
-                    response_parts.append(f"   🔗 Profile: {talent.profile_url}")
-            
-            response_parts.append("\n\nWould you like me to provide more details about any of these candidates or search for additional talent?")
-            
-            return "\n".join(response_parts)
+    @staticmethod
+    def _fallback_results_response(talent_results: List[Talent]) -> str:
+        """Simple formatting used when the formatting model is unavailable."""
+        response_parts = [f"✅ Great! I found {len(talent_results)} talented candidates for you:\n"]
+        
+        for i, talent in enumerate(talent_results[:5], 1):
+            response_parts.append(f"\n{i}. **{talent.title}**")
+            response_parts.append(f"   💼 Skills: {', '.join(talent.skill_keywords[:5])}")
+            response_parts.append(f"   ⭐ Experience: {talent.experience_years}")
+            response_parts.append(f"   📊 Risk Score: {talent.risk_score}/5")
+            if talent.profile_url:
+                response_parts.append(f"   🔗 Profile: {talent.profile_url}")
+        
+        response_parts.append("\n\nWould you like me to provide more details about any of these candidates or search for additional talent?")
+        
+        return "\n".join(response_parts)
+
+    async def _compact_history(self):
+        """Fold older messages into the running summary once the history grows past the trigger."""
+        if len(self.conversation_history) <= HISTORY_SUMMARY_TRIGGER:
+            return
+        
+        older_messages = self.conversation_history[:-HISTORY_KEEP_RECENT]
+        
+        summary_input = json.dumps({"summary": self.history_summary, "messages": older_messages})
+        cache_key = hashlib.sha256(summary_input.encode()).hexdigest()
+        
+        summary = _summary_cache.get(cache_key)
+        if summary is None:
+            try:
+                response = await create_chat_completion(
+                    model=SUMMARY_MODEL,
+                    messages=[
+                        {"role": "system", "content": "Summarize this talent search conversation in a few sentences. Keep the requested skills, seniority, quantities and any candidates discussed."},
+                        {"role": "user", "content": summary_input}
+                    ],
+                    temperature=0,
+                    max_tokens=SUMMARY_MAX_TOKENS
+                )
+                summary = _summary_cache[cache_key] = response.choices[0].message.content.strip()
+            except Exception as e:
+                # Keep the older messages so the next turn retries; the prompt window stays bounded anyway
+                logger.error(f"❌ History summarization error: {str(e)}")
+                return
+        
+        # Only drop the older messages once they are part of the summary
+        self.history_summary = summary
+        self.conversation_history = self.conversation_history[len(older_messages):]
+        logger.info(f"🗜️ Folded {len(older_messages)} messages into the conversation summary")
 
     def reset_conversation(self):
         """Reset the conversation history."""
         self.conversation_history = []
+        self.history_summary = None
         logger.info("🔄 Conversation history reset")
 
     def get_conversation_summary(self) -> str:
         """Get a summary of the current conversation."""
         if not self.conversation_history:
-            return "No conversation history yet."
+            return NO_HISTORY_SUMMARY
         
         messages_count = len(self.conversation_history)
         user_messages = len([msg for msg in self.conversation_history if msg["role"] == "user"])
@@ -2,14 +2,16 @@
 API module for the Term Simplifier.
 Contains FastAPI routes for the technical term simplification service.
 """
-from fastapi import APIRouter, HTTPException, Request
-from pydantic import BaseModel
-from typing import Dict, Optional
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict
+from typing import AsyncIterator, List, Optional
 import os
+import json
 import logging
 from dotenv import load_dotenv
-from openai import AsyncOpenAI
-from .service import SimplifierService
+from .service import SimplifierService, SIMPLIFIER_MODEL, SIMPLIFIER_SEED, SYSTEM_PROMPT, FALLBACK_EXPLANATION
+from .cache import DEFAULT_TTL, explanation_cache, make_cache_key
 
 # Load environment variables
 load_dotenv()
@@ -23,10 +25,9 @@ router = APIRouter(prefix="/simplifier", tags=["simplifier"])
 # Initialize simplifier service
 simplifier_service = SimplifierService()
 
-# In-memory cache for explanations
-explanation_cache: Dict[str, str] = {}
-
 class SimplificationRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+    
     term: str
     context: Optional[str] = None
 
@@ -35,10 +36,54 @@ class SimplificationResponse(BaseModel):
     explanation: str
     cached: bool = False
 
+class SimplificationBatchRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+    
+    terms: List[str]
+    context: Optional[str] = None
+
+class SimplificationBatchResponse(BaseModel):
+    results: List[SimplificationResponse]
+
+# Upper bound on terms per batch request
+MAX_BATCH_TERMS = 20
+
+# Explanations are stable for as long as the server caches them, so clients may reuse them too
+CACHEABLE = f"public, max-age={DEFAULT_TTL}"
+
+def _set_cache_headers(response: Response, cached: bool, cacheable: bool = True) -> None:
+    """Tell clients whether the explanation came from the cache and how long to keep it."""
+    response.headers["Cache-Control"] = CACHEABLE if cacheable else "no-store"
+    response.headers["X-Cache"] = "HIT" if cached else "MISS"
+
+def _sse_event(data: str) -> str:
+    """Format a piece of text as a Server-Sent Event; the text is JSON-encoded so newlines survive."""
+    return f"data: {json.dumps(data)}\n\n"
+
+async def _stream_explanation(term: str, context: Optional[str], cache_key: str) -> AsyncIterator[str]:
+    """Forward explanation tokens as they arrive, then cache the full text."""
+    parts = []
+    try:
+        async for delta in simplifier_service.stream_term(term, context):
+            parts.append(delta)
+            yield _sse_event(delta)
+    except Exception as e:
+        logger.error("Error streaming explanation: %s", e)
+        if not parts:
+            yield _sse_event(FALLBACK_EXPLANATION)
+        yield "data: [DONE]\n\n"
+        return
+    
+    explanation = "".join(parts).strip()
+    if explanation:
+        await explanation_cache.set(cache_key, {"term": term, "explanation": explanation})
+    yield "data: [DONE]\n\n"
+
 @router.post("/explain", response_model=SimplificationResponse)
-async def explain_term(request: SimplificationRequest):
+async def explain_term(request: SimplificationRequest, response: Response, stream: bool = False):
     """
     Get a simplified explanation of a technical term.
+    With ?stream=true the explanation is sent as Server-Sent Events while it is generated.
     """
     term = request.term.strip()
     
@@ -46,20 +91,37 @@ async def explain_term(request: SimplificationRequest):
         raise HTTPException(status_code=400, detail="Term cannot be empty")
     
     # Check cache first
-    if term.lower() in explanation_cache:
-        logger.info(f"Cache hit for term: {term}")
+    cache_key = make_cache_key(term, SIMPLIFIER_MODEL, SYSTEM_PROMPT, SIMPLIFIER_SEED, request.context)
+    cached_entry = await explanation_cache.get(cache_key)
+    if cached_entry:
+        logger.info("Cache hit for term: %s", term)
+        _set_cache_headers(response, cached=True)
+        if stream:
+            return StreamingResponse(
+                iter((_sse_event(cached_entry["explanation"]), "data: [DONE]\n\n")),
+                media_type="text/event-stream",
+                headers={"Cache-Control": response.headers["Cache-Control"], "X-Cache": "HIT"}
+            )
         return SimplificationResponse(
             term=term,
-            explanation=explanation_cache[term.lower()],
+            explanation=cached_entry["explanation"],
             cached=True
         )
     
+    if stream:
+        return StreamingResponse(
+            _stream_explanation(term, request.context, cache_key),
+            media_type="text/event-stream"
+        )
+    
     # Generate explanation using the service
     try:
         explanation = await simplifier_service.simplify_term(term, request.context)
         
-        # Cache the explanation
-        explanation_cache[term.lower()] = explanation
+        # Cache the explanation (failures are not cached so they can be retried)
+        if explanation != FALLBACK_EXPLANATION:
+            await explanation_cache.set(cache_key, {"term": term, "explanation": explanation})
+        _set_cache_headers(response, cached=False, cacheable=explanation != FALLBACK_EXPLANATION)
         
         return SimplificationResponse(
             term=term,
@@ -68,20 +130,69 @@ async def explain_term(request: SimplificationRequest):
         )
         
     except Exception as e:
-        logger.error(f"Error generating explanation: {str(e)}")
+        logger.error("Error generating explanation: %s", e)
         raise HTTPException(
             status_code=500, 
             detail=f"Failed to generate explanation: {str(e)}"
         )
 
+@router.post("/explain-batch", response_model=SimplificationBatchResponse)
+async def explain_terms(request: SimplificationBatchRequest):
+    """
+    Get simplified explanations for several technical terms at once.
+    Cached terms are answered directly; the rest share a single OpenAI request.
+    """
+    terms = [term.strip() for term in request.terms if term.strip()]
+    
+    if not terms:
+        raise HTTPException(status_code=400, detail="At least one term is required")
+    if len(terms) > MAX_BATCH_TERMS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_TERMS} terms are allowed per request")
+    
+    # Check cache first
+    cache_keys = {term: make_cache_key(term, SIMPLIFIER_MODEL, SYSTEM_PROMPT, SIMPLIFIER_SEED, request.context)
+                  for term in terms}
+    cached_entries = {}
+    for term, cache_key in cache_keys.items():
+        cached_entry = await explanation_cache.get(cache_key)
+        if cached_entry:
+            cached_entries[term] = cached_entry["explanation"]
+    
+    missing_terms = [term for term in terms if term not in cached_entries]
+    logger.info("Batch request for %s terms, %s cache hits", len(terms), len(cached_entries))
+    
+    # Generate the remaining explanations in one request
+    try:
+        generated = await simplifier_service.simplify_terms(missing_terms, request.context) if missing_terms else {}
+    except Exception as e:
+        logger.error("Error generating explanations: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to generate explanations: {str(e)}"
+        )
+    
+    results = []
+    for term in terms:
+        if term in cached_entries:
+            results.append(SimplificationResponse(term=term, explanation=cached_entries[term], cached=True))
+            continue
+        
+        explanation = generated.get(term.lower(), FALLBACK_EXPLANATION)
+        if explanation != FALLBACK_EXPLANATION:
+            await explanation_cache.set(cache_keys[term], {"term": term, "explanation": explanation})
+        results.append(SimplificationResponse(term=term, explanation=explanation, cached=False))
+    
+    return SimplificationBatchResponse(results=results)
+
 @router.get("/cache/stats")
 async def get_cache_stats():
     """
     Get statistics about the explanation cache.
     """
+    entries = await explanation_cache.entries()
     return {
-        "total_cached_terms": len(explanation_cache),
-        "cached_terms": list(explanation_cache.keys())
+        "total_cached_terms": len(entries),
+        "cached_terms": [entry["term"] for entry in entries]
     }
 
 @router.delete("/cache/clear")
@@ -89,9 +200,8 @@ async def clear_cache():
     """
     Clear the explanation cache.
     """
-    global explanation_cache
-    cache_size = len(explanation_cache)
-    explanation_cache = {}
+    cache_size = await explanation_cache.clear()
+    simplifier_service.clear_cache()
     
     return {
         "message": f"Cache cleared. {cache_size} terms removed.",
@@ -0,0 +1,208 @@
+"""
+Cache module for the Term Simplifier.
+Stores generated explanations so repeated terms skip the OpenAI round-trip.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import operator
+import os
+import time
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Optional, Protocol, Sequence, Tuple
+
+from cachetools import TTLCache
+from dotenv import load_dotenv
+
+try:
+    import redis.asyncio as redis
+except ImportError:  # Redis is optional; without it the in-memory cache is used
+    redis = None
+
+# Load environment variables
+load_dotenv()
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Explanations are kept for a day
+DEFAULT_TTL = 86400
+
+# Upper bound on explanations held by the in-memory cache
+SIMPLIFIER_CACHE_SIZE = int(os.getenv("SIMPLIFIER_CACHE_SIZE", "10000"))
+
+
+def make_cache_key(term: str, model: str, system_prompt: str, seed: Optional[int] = None,
+                   context: Optional[str] = None) -> str:
+    """Build a stable cache key from everything that shapes the explanation."""
+    payload = json.dumps(
+        {"m": model, "sys": system_prompt, "seed": seed, "t": term.lower().strip(), "ctx": context or ""},
+        sort_keys=True
+    )
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+class CacheBackend(Protocol):
+    """
+    Storage for generated explanations.
+    Entries are stored as {"term": ..., "explanation": ...} dicts.
+    """
+
+    async def get(self, key: str) -> Optional[Dict[str, str]]:
+        """Return the cached entry for a key, or None on a miss."""
+        ...
+
+    async def set(self, key: str, entry: Dict[str, str]) -> None:
+        """Store an entry under a key."""
+        ...
+
+    async def entries(self) -> List[Dict[str, str]]:
+        """Return all cached entries."""
+        ...
+
+    async def clear(self) -> int:
+        """Remove all cached entries and return how many were removed."""
+        ...
+
+
+class InMemoryBackend:
+    """Per-process explanation cache bounded by size and age."""
+
+    def __init__(self, maxsize: int = SIMPLIFIER_CACHE_SIZE, ttl: int = DEFAULT_TTL):
+        self._memory = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, key: str) -> Optional[Dict[str, str]]:
+        return self._memory.get(key)
+
+    async def set(self, key: str, entry: Dict[str, str]) -> None:
+        self._memory[key] = entry
+
+    async def entries(self) -> List[Dict[str, str]]:
+        return list(self._memory.values())
+
+    async def clear(self) -> int:
+        removed = len(self._memory)
+        self._memory.clear()
+        return removed
+
+
+class RedisBackend:
+    """
+    Explanation cache shared by every worker through Redis.
+    Keys are namespaced so stats and clears only touch simplifier entries.
+    """
+
+    def __init__(self, url: str, ttl: int = DEFAULT_TTL, namespace: str = "simplifier:v1"):
+        self.ttl = ttl
+        self.namespace = namespace
+        self._redis = redis.from_url(url, decode_responses=True)
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    async def _keys(self) -> List[str]:
+        return [key async for key in self._redis.scan_iter(match=self._redis_key("*"), count=500)]
+
+    async def get(self, key: str) -> Optional[Dict[str, str]]:
+        try:
+            value = await self._redis.get(self._redis_key(key))
+        except Exception as e:
+            logger.error("Cache read failed: %s", e)
+            return None
+        return json.loads(value) if value else None
+
+    async def set(self, key: str, entry: Dict[str, str]) -> None:
+        try:
+            await self._redis.set(self._redis_key(key), json.dumps(entry), ex=self.ttl)
+        except Exception as e:
+            logger.error("Cache write failed: %s", e)
+
+    async def entries(self) -> List[Dict[str, str]]:
+        keys = await self._keys()
+        if not keys:
+            return []
+        values = await self._redis.mget(keys)
+        return [json.loads(value) for value in values if value]
+
+    async def clear(self) -> int:
+        keys = await self._keys()
+        if keys:
+            await self._redis.delete(*keys)
+        return len(keys)
+
+
+def create_cache_backend(url: Optional[str] = None) -> CacheBackend:
+    """Use Redis when a CACHE_URL is configured, otherwise an in-process cache."""
+    if url and redis is not None:
+        return RedisBackend(url)
+    if url:
+        logger.warning("CACHE_URL is set but the redis package is not installed; using in-memory cache")
+    return InMemoryBackend()
+
+
+class SemanticCache:
+    """
+    Embedding-based cache that matches near-duplicate terms
+    ("REST API", "rest apis") to an already generated explanation.
+    Vectors are L2-normalized on insert so cosine similarity is a dot product.
+    Only entries generated for the same context are considered a match.
+    """
+
+    def __init__(self, threshold: float = 0.92, maxsize: int = 1000, ttl: int = DEFAULT_TTL):
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, Optional[str]], Tuple[array, str, float]]" = OrderedDict()
+
+    @staticmethod
+    def normalize(vector: Sequence[float]) -> array:
+        """Return an L2-normalized compact copy of an embedding vector."""
+        norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+        return array("f", (value / norm for value in vector))
+
+    async def lookup(self, vector: array, context: Optional[str] = None) -> Optional[str]:
+        """Return the explanation of the most similar cached term for the same context above the threshold."""
+        now = time.monotonic()
+        # Snapshot on the event loop so the scan below never sees the dict change under it
+        candidates = [
+            (cached_vector, explanation)
+            for (_, cached_context), (cached_vector, explanation, created_at) in self._entries.items()
+            if cached_context == context and now - created_at <= self.ttl
+        ]
+        if not candidates:
+            return None
+        # The scan is linear in the number of entries, so it runs off the event loop
+        return await asyncio.to_thread(self._best_match, vector, candidates, self.threshold)
+
+    @staticmethod
+    def _best_match(vector: array, candidates: List[Tuple[array, str]], threshold: float) -> Optional[str]:
+        best_explanation, best_score = None, threshold
+        for cached_vector, explanation in candidates:
+            score = sum(map(operator.mul, vector, cached_vector))
+            if score >= best_score:
+                best_explanation, best_score = explanation, score
+        return best_explanation
+
+    def add(self, term: str, vector: array, explanation: str, context: Optional[str] = None) -> None:
+        """Store a normalized term vector with its explanation, evicting the oldest entries."""
+        key = (term, context)
+        self._entries[key] = (vector, explanation, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> int:
+        """Remove all entries and return how many were removed."""
+        removed = len(self._entries)
+        self._entries.clear()
+        return removed
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared explanation cache used by every simplifier endpoint
+explanation_cache = create_cache_backend(os.getenv("CACHE_URL"))
@@ -3,10 +3,14 @@ Service module for the Term Simplifier.
 Contains the business logic for simplifying technical terms.
 """
 import os
+import asyncio
+import json
 import logging
-from typing import Dict, Optional, List
-from openai import AsyncOpenAI
+from array import array
+from typing import AsyncIterator, Dict, FrozenSet, Optional, List
 from dotenv import load_dotenv
+from llm_client import openai_client, create_chat_completion, create_embedding
+from .cache import SemanticCache
 
 # Load environment variables
 load_dotenv()
@@ -14,6 +18,59 @@ load_dotenv()
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Model, seed and prompt used for every explanation; all are part of the cache key.
+# Temperature 0 with a fixed seed keeps explanations deterministic, so caching them is safe.
+SIMPLIFIER_MODEL = os.getenv("SIMPLIFIER_MODEL", "gpt-4o-mini")
+SIMPLIFIER_SEED = 42
+SIMPLIFIER_TEMPERATURE = 0
+SIMPLIFIER_MAX_TOKENS = 80
+SYSTEM_PROMPT = """You are a helpful assistant that explains technical terms in extremely 
+                    simple, non-technical language. Your target audience is people with no technical 
+                    background at all. Use everyday analogies, avoid all jargon, and keep explanations 
+                    under 2-3 short sentences. Use the simplest language possible, like explaining to a child."""
+
+# System message shared by every request, so prompts (and cache keys) stay identical
+SIMPLIFIER_SYSTEM = {"role": "system", "content": SYSTEM_PROMPT}
+
+def build_messages(term: str, context: Optional[str] = None) -> List[Dict[str, str]]:
+    """Build the chat messages for explaining a single term."""
+    messages = [
+        SIMPLIFIER_SYSTEM,
+        {"role": "user", "content": f"Explain '{term}' in the simplest way possible. No technical terms allowed."}
+    ]
+    if context:
+        messages.append({"role": "user", "content": f"I saw this term in this context: {context}"})
+    return messages
+
+# Embeddings used to match near-duplicate terms in the semantic cache
+EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_DIMENSIONS = 256
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SIMPLIFIER_SEMANTIC_THRESHOLD", "0.92"))
+# Terms kept for semantic matching; each lookup scans them linearly
+SEMANTIC_CACHE_SIZE = int(os.getenv("SIMPLIFIER_SEMANTIC_CACHE_SIZE", "1000"))
+# Seconds to wait for an embedding before generating without the semantic cache
+SEMANTIC_EMBED_TIMEOUT = float(os.getenv("SIMPLIFIER_EMBED_TIMEOUT", "2"))
+
+# Common technical terms; this would ideally come from a file, but for simplicity they are hardcoded
+_TECHNICAL_TERMS: FrozenSet[str] = frozenset({
+    "api", "rest", "json", "http", "url", "html", "css", "javascript",
+    "python", "database", "sql", "server", "client", "backend", "frontend",
+    "framework", "library", "function", "variable", "algorithm", "data structure",
+    "cloud", "hosting", "deployment", "container", "docker", "kubernetes",
+    "microservice", "authentication", "authorization", "encryption", "api key",
+    "endpoint", "request", "response", "status code", "header", "payload",
+    "git", "repository", "commit", "branch", "merge", "pull request",
+    "compiler", "interpreter", "runtime", "debugging", "testing", "unit test",
+    "integration test", "continuous integration", "continuous deployment",
+    "agile", "scrum", "waterfall", "sprint", "backlog", "user story",
+    "bandwidth", "latency", "throughput", "cache", "memory", "cpu", "gpu",
+    "thread", "process", "asynchronous", "synchronous", "concurrency",
+    "ajax", "xml", "yaml", "markdown", "regex", "expression", "statement"
+})
+
+# Returned when an explanation could not be generated; never cached
+FALLBACK_EXPLANATION = "Sorry, I couldn't explain that term right now."
+
 class SimplifierService:
     """Service for simplifying technical terms using OpenAI."""
     
@@ -22,34 +79,102 @@ class SimplifierService:
         if not self.api_key:
             logger.warning("OpenAI API key not found in environment variables")
             
-        self.openai_client = AsyncOpenAI(api_key=self.api_key)
-        self.cache: Dict[str, str] = {}
-        self.technical_terms: List[str] = self._load_common_technical_terms()
+        self.openai_client = openai_client
+        self.semantic_cache = SemanticCache(threshold=SEMANTIC_CACHE_THRESHOLD, maxsize=SEMANTIC_CACHE_SIZE)
+        self.technical_terms: FrozenSet[str] = _TECHNICAL_TERMS
     
     async def simplify_term(self, term: str, context: Optional[str] = None) -> str:
-        """Generate a simple explanation for a technical term."""
+        """
+        Generate a simple explanation for a technical term.
+        Exact matches are served by the shared explanation cache before this is called.
+        """
         term = term.strip().lower()
         
-        # Check cache first
-        if term in self.cache:
-            logger.info(f"Using cached explanation for: {term}")
-            return self.cache[term]
+        # Look for a near-duplicate term first; only a true miss pays for a chat completion
+        try:
+            vector = await asyncio.wait_for(self._embed(term), timeout=SEMANTIC_EMBED_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning("Embedding timed out for '%s', skipping semantic cache", term)
+            vector = None
+        if vector is not None:
+            explanation = await self.semantic_cache.lookup(vector, context)
+            if explanation:
+                logger.info("Using semantically cached explanation for: %s", term)
+                return explanation
         
         try:
-            logger.info(f"Generating explanation for: {term}")
+            explanation = await self._generate(term, context)
+            if vector is not None:
+                self.semantic_cache.add(term, vector, explanation, context)
+            
+            logger.info("Generated explanation for '%s'", term)
+            return explanation
+            
+        except Exception as e:
+            logger.error("Error simplifying term '%s': %s", term, e)
+            return FALLBACK_EXPLANATION
+    
+    async def _generate(self, term: str, context: Optional[str] = None) -> str:
+        """Generate an explanation for a normalized term with a single OpenAI request."""
+        logger.info("Generating explanation for: %s", term)
+        response = await create_chat_completion(
+            model=SIMPLIFIER_MODEL,
+            messages=build_messages(term, context),
+            max_tokens=SIMPLIFIER_MAX_TOKENS,
+            temperature=SIMPLIFIER_TEMPERATURE,
+            seed=SIMPLIFIER_SEED,
+            response_format={"type": "text"}
+        )
+        return response.choices[0].message.content.strip()
+    
+    async def stream_term(self, term: str, context: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        Stream a simple explanation for a technical term as it is generated.
+        The semantic cache is skipped so the first token is not delayed by an embedding call;
+        exact matches are served by the shared explanation cache before this is called.
+        """
+        term = term.strip().lower()
+        
+        logger.info("Streaming explanation for: %s", term)
+        stream = await create_chat_completion(
+            model=SIMPLIFIER_MODEL,
+            messages=build_messages(term, context),
+            max_tokens=SIMPLIFIER_MAX_TOKENS,
+            temperature=SIMPLIFIER_TEMPERATURE,
+            seed=SIMPLIFIER_SEED,
+            response_format={"type": "text"},
+            stream=True
+        )
+        
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                yield delta
+    
+    async def simplify_terms(self, terms: List[str], context: Optional[str] = None) -> Dict[str, str]:
+        """
+        Generate explanations for several terms with a single OpenAI request.
+        Returns a mapping of normalized (stripped, lowercased) term to explanation.
+        Cached terms are filtered out against the shared explanation cache before this is called.
+        """
+        missing_terms = list(dict.fromkeys(term.strip().lower() for term in terms))
+        explanations: Dict[str, str] = {}
+        
+        if not missing_terms:
+            return explanations
+        
+        try:
+            logger.info("Generating explanations for %s terms in one request", len(missing_terms))
             
-            # Prepare messages for OpenAI
             messages = [
-                {
-                    "role": "system",
-                    "content": """You are a helpful assistant that explains technical terms in extremely 
-                    simple, non-technical language. Your target audience is people with no technical 
-                    background at all. Use everyday analogies, avoid all jargon, and keep explanations 
-                    under 2-3 short sentences. Use the simplest language possible, like explaining to a child."""
-                },
+                SIMPLIFIER_SYSTEM,
                 {
                     "role": "user",
-                    "content": f"Explain '{term}' in the simplest way possible. No technical terms allowed."
+                    "content": (
+                        "Explain each of these terms in the simplest way possible. No technical terms allowed. "
+                        "Return a JSON object mapping each term, exactly as given, to its explanation. "
+                        f"Terms: {json.dumps(missing_terms)}"
+                    )
                 }
             ]
             
@@ -57,27 +182,47 @@ class SimplifierService:
             if context:
                 messages.append({
                     "role": "user",
-                    "content": f"I saw this term in this context: {context}"
+                    "content": f"I saw these terms in this context: {context}"
                 })
             
-            response = await self.openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
+            response = await create_chat_completion(
+                model=SIMPLIFIER_MODEL,
                 messages=messages,
-                max_tokens=150,
-                temperature=0.5
+                # Leave some room per term for the JSON keys and quoting
+                max_tokens=(SIMPLIFIER_MAX_TOKENS + 20) * len(missing_terms),
+                temperature=SIMPLIFIER_TEMPERATURE,
+                seed=SIMPLIFIER_SEED,
+                response_format={"type": "json_object"}
             )
             
-            explanation = response.choices[0].message.content.strip()
-            
-            # Cache the explanation
-            self.cache[term] = explanation
-            
-            logger.info(f"Generated explanation for '{term}'")
-            return explanation
+            generated = json.loads(response.choices[0].message.content)
+            generated = {str(key).strip().lower(): str(value).strip() for key, value in generated.items()}
             
+            for term in missing_terms:
+                if generated.get(term):
+                    explanations[term] = generated[term]
+                    
         except Exception as e:
-            logger.error(f"Error simplifying term '{term}': {str(e)}")
-            return f"Sorry, I couldn't explain that term right now."
+            logger.error("Error simplifying terms %s: %s", missing_terms, e)
+        
+        # Anything the model skipped or failed on gets the fallback text
+        for term in missing_terms:
+            explanations.setdefault(term, FALLBACK_EXPLANATION)
+        
+        return explanations
+    
+    async def _embed(self, term: str) -> Optional[array]:
+        """Embed a term for semantic cache lookups; returns None if embedding fails."""
+        try:
+            response = await create_embedding(
+                model=EMBEDDING_MODEL,
+                input=term,
+                extra_body={"dimensions": EMBEDDING_DIMENSIONS}
+            )
+            return SemanticCache.normalize(response.data[0].embedding)
+        except Exception as e:
+            logger.warning("Embedding failed for '%s', skipping semantic cache: %s", term, e)
+            return None
     
     def is_technical_term(self, term: str) -> bool:
         """Check if a word is likely to be a technical term."""
@@ -95,26 +240,5 @@ class SimplifierService:
         return True
     
     def clear_cache(self) -> int:
-        """Clear the explanation cache and return number of items cleared."""
-        cache_size = len(self.cache)
-        self.cache = {}
-        return cache_size
-    
-    def _load_common_technical_terms(self) -> List[str]:
-        """Load a list of common technical terms."""
-        # This would ideally come from a file, but for simplicity we'll hardcode some
-        return [
-            "api", "rest", "json", "http", "url", "html", "css", "javascript",
-            "python", "database", "sql", "server", "client", "backend", "frontend",
-            "framework", "library", "function", "variable", "algorithm", "data structure",
-            "cloud", "hosting", "deployment", "container", "docker", "kubernetes",
-            "microservice", "authentication", "authorization", "encryption", "api key",
-            "endpoint", "request", "response", "status code", "header", "payload",
-            "git", "repository", "commit", "branch", "merge", "pull request",
-            "compiler", "interpreter", "runtime", "debugging", "testing", "unit test",
-            "integration test", "continuous integration", "continuous deployment",
-            "agile", "scrum", "waterfall", "sprint", "backlog", "user story",
-            "bandwidth", "latency", "throughput", "cache", "memory", "cpu", "gpu",
-            "thread", "process", "asynchronous", "synchronous", "concurrency",
-            "ajax", "xml", "yaml", "markdown", "regex", "expression", "statement"
-        ]
+        """Clear the semantic cache and return number of items cleared."""
+        return self.semantic_cache.clear()
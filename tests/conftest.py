@@ -1,19 +1,189 @@
 """
 Pytest configuration file with shared fixtures.
 """
+import asyncio
+import copy
+import functools
+import hashlib
+import json
+import orjson
 import pytest
+import pytest_asyncio
+import respx
 import os
-from dotenv import load_dotenv
+from dotenv import dotenv_values, find_dotenv
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient, Response
 
-# Load environment variables for tests
-@pytest.fixture(scope="session", autouse=True)
-def load_env():
-    """Load environment variables before running tests."""
-    load_dotenv()
+@functools.lru_cache(maxsize=1)
+def _parsed_env():
+    """Parse .env once per process."""
+    return dotenv_values(find_dotenv())
+
+def pytest_sessionstart(session):
+    """Load environment variables once, before collection and outside the fixture graph."""
+    # Variables already in the environment win, as with load_dotenv()
+    if not os.environ.get("_DOTENV_LOADED"):
+        os.environ.update({
+            key: value for key, value in _parsed_env().items()
+            if value is not None and key not in os.environ
+        })
+        os.environ["_DOTENV_LOADED"] = "1"
+    
+    # Dummy keys let the API clients be built; every API call is mocked anyway
+    for key in ("OPENAI_API_KEY", "TAVILY_API_KEY"):
+        if not os.getenv(key):
+            print(f"⚠️ {key} not set, using a dummy key")
+            os.environ[key] = "test-dummy-key"
+
+# Tests that go through the (mocked) LLM pipeline; they run after the cheap ones
+SLOW_TEST_NAMES = ("chat_endpoint", "chat_stream_endpoint", "explain_")
+
+def pytest_collection_modifyitems(config, items):
+    """Run fast tests first so a broken static endpoint fails before the LLM-backed tests.
+    Tests are moved by module or class, never split apart, so class-scoped fixtures are set
+    up once and tests within a class keep their file order. With --ff, previously failed
+    tests still go first, since the cache provider reorders after this hook.
+    Use --lf to rerun only the last failures."""
+    slow_groups = {
+        item.parent.nodeid for item in items
+        if any(name in item.name for name in SLOW_TEST_NAMES)
+    }
+    items.sort(key=lambda item: item.parent.nodeid in slow_groups)
+
+async def _skip_warm_up():
+    """Stand-in for llm_client.warm_clients: no warm-up pings and no keep-alive task."""
+
+@pytest.fixture(scope="session")
+def app_module():
+    """The application, imported once and only after the environment is loaded.
+    Startup runs before any per-test API mock is active, so its network warm-up is disabled."""
+    import app
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(app, "warm_clients", _skip_warm_up)
+        yield app.app
+
+@pytest.fixture(scope="session")
+def client(app_module):
+    """One test client for the whole session; startup and shutdown handlers run once."""
+    with TestClient(app_module) as test_client:
+        yield test_client
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """One event loop for the session, so the async client below can be shared."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+@pytest_asyncio.fixture(scope="session")
+async def aclient(app_module):
+    """Async client calling the app in-process, without a thread portal per request."""
+    async with AsyncClient(transport=ASGITransport(app=app_module), base_url="http://test") as async_client:
+        yield async_client
+
+@pytest.fixture(scope="session")
+def rjson():
+    """Decode a response body with orjson."""
+    return lambda response: orjson.loads(response.content)
+
+# Canned text returned by the mocked OpenAI API
+CANNED_REPLY = "A simple canned answer."
+
+def _chat_completion(request):
+    """Answer a chat completion request in whatever shape the caller asked for."""
+    body = json.loads(request.content)
+    if body.get("stream"):
+        chunk = {
+            "id": "chatcmpl-test", "object": "chat.completion.chunk", "created": 0, "model": body["model"],
+            "choices": [{"index": 0, "delta": {"content": CANNED_REPLY}, "finish_reason": None}]
+        }
+        stream = f"data: {json.dumps(chunk)}\n\ndata: [DONE]\n\n"
+        return Response(200, content=stream, headers={"content-type": "text/event-stream"})
     
-    # Verify required environment variables
-    if not os.getenv("OPENAI_API_KEY"):
-        print("⚠️ Warning: OPENAI_API_KEY not set. Some tests will be skipped.")
+    content = CANNED_REPLY
+    if body.get("response_format", {}).get("type") == "json_object":
+        prompt = body["messages"][1]["content"] if len(body["messages"]) > 1 else ""
+        if "Terms: " in prompt:
+            # Batch explanation: one entry per requested term
+            terms = json.loads(prompt.split("Terms: ", 1)[1])
+            content = json.dumps({term: CANNED_REPLY for term in terms})
+        else:
+            # Intent analysis: a plain conversational reply
+            content = json.dumps({"is_talent_request": False, "reply": CANNED_REPLY})
+    
+    return Response(200, json=_completion(content, body["model"]))
+
+def _completion(content, model="gpt-4o-mini"):
+    """A non-streamed chat completion body with the given reply text."""
+    return {
+        "id": "chatcmpl-test", "object": "chat.completion", "created": 0, "model": model,
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}
+    }
+
+def _embedding(request):
+    """A deterministic embedding per input, so different terms do not look like near-duplicates."""
+    text = json.loads(request.content)["input"]
+    vector = [byte - 128 for byte in hashlib.sha256(text.encode()).digest()[:16]]
+    return Response(200, json={
+        "object": "list", "model": "text-embedding-3-small",
+        "data": [{"object": "embedding", "index": 0, "embedding": vector}],
+        "usage": {"prompt_tokens": 1, "total_tokens": 1}
+    })
+
+@pytest.fixture(autouse=True)
+def mock_apis():
+    """Serve OpenAI and Tavily from canned responses so no test touches the network."""
+    with respx.mock(assert_all_called=False) as respx_mock:
+        respx_mock.post("https://api.openai.com/v1/chat/completions", name="openai_chat").mock(side_effect=_chat_completion)
+        respx_mock.post("https://api.openai.com/v1/embeddings").mock(side_effect=_embedding)
+        respx_mock.post("https://api.tavily.com/search", name="tavily_search").respond(200, json={"results": []})
+        yield respx_mock
+
+@pytest.fixture
+def openai_reply(mock_apis):
+    """Make the mocked OpenAI API answer every chat completion with the given text."""
+    def reply_with(content):
+        mock_apis["openai_chat"].mock(return_value=Response(200, json=_completion(content)))
+    return reply_with
+
+@pytest.fixture(scope="session")
+def warm_cache():
+    """Canned explanation cache entries, built once per session."""
+    from term_simplifier.cache import make_cache_key
+    from term_simplifier.service import SIMPLIFIER_MODEL, SIMPLIFIER_SEED, SYSTEM_PROMPT
+    
+    return {
+        make_cache_key(term, SIMPLIFIER_MODEL, SYSTEM_PROMPT, SIMPLIFIER_SEED): {"term": term, "explanation": explanation}
+        for term, explanation in (
+            ("API", "A menu that lets one program order things from another."),
+            ("JSON", "A tidy way of writing information so computers can read it.")
+        )
+    }
+
+@pytest.fixture
+def isolated_cache(warm_cache, monkeypatch):
+    """A private copy of the warm cache, swapped in for the simplifier endpoints."""
+    from term_simplifier import api
+    from term_simplifier.cache import InMemoryBackend
+    
+    cache = InMemoryBackend()
+    
+    async def fill():
+        for key, entry in copy.deepcopy(warm_cache).items():
+            await cache.set(key, entry)
+    
+    asyncio.run(fill())
+    monkeypatch.setattr(api, "explanation_cache", cache)
+    return cache
+
+@pytest.fixture
+def fresh_simplifier(monkeypatch):
+    """A simplifier service with an empty semantic cache, swapped in for the simplifier endpoints."""
+    from term_simplifier import api
+    from term_simplifier.service import SimplifierService
     
-    if not os.getenv("TAVILY_API_KEY"):
-        print("⚠️ Warning: TAVILY_API_KEY not set. Some tests will be skipped.")
+    service = SimplifierService()
+    monkeypatch.setattr(api, "simplifier_service", service)
+    return service
@@ -4,32 +4,15 @@ To run these tests:
     pytest -xvs tests/test_app.py
 """
 import pytest
-from fastapi.testclient import TestClient
-from app import app
 
-# Test client for FastAPI
-client = TestClient(app)
-
-def test_root_endpoint():
-    """Test the root endpoint."""
-    response = client.get("/")
-    assert response.status_code == 200
-    data = response.json()
-    assert "message" in data
-    assert data["message"] == "AI Talent Tools API"
-    assert "endpoints" in data
-
-def test_health_endpoint():
-    """Test the health check endpoint."""
-    response = client.get("/health")
-    assert response.status_code == 200
-    data = response.json()
-    assert "status" in data
-    assert data["status"] == "healthy"
-
-def test_simplifier_demo_page():
-    """Test the simplifier demo page."""
-    response = client.get("/simplifier-demo")
+@pytest.mark.parametrize("path,needles", [
+    ("/", ('"message":"AI Talent Tools API"', '"endpoints"')),
+    ("/health", ('"status":"healthy"', '"active_chats":0')),
+    ("/simplifier-demo", ("<html", "Technical Term Simplifier Demo")),
+])
+def test_static_endpoints(client, path, needles):
+    """Test the root, health check and simplifier demo pages."""
+    response = client.get(path)
     assert response.status_code == 200
-    assert "html" in response.text.lower()
-    assert "Technical Term Simplifier Demo" in response.text
+    for needle in needles:
+        assert needle in response.text
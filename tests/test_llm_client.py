@@ -0,0 +1,38 @@
+"""
+Unit tests for the shared API client helpers.
+To run these tests:
+    pytest -xvs tests/test_llm_client.py
+"""
+import time
+import pytest
+
+class TestTokenBucket:
+    """Tests for the request and token budget."""
+    
+    @pytest.mark.asyncio
+    async def test_full_budget_is_available_immediately(self):
+        """Test that a fresh bucket hands out a whole minute's budget without waiting."""
+        from llm_client import TokenBucket
+        bucket = TokenBucket(600)
+        start = time.monotonic()
+        await bucket.acquire(600)
+        assert time.monotonic() - start < 0.05
+    
+    @pytest.mark.asyncio
+    async def test_waits_for_refill_once_drained(self):
+        """Test that a drained bucket waits until enough tokens have refilled."""
+        from llm_client import TokenBucket
+        bucket = TokenBucket(6000)  # Refills 100 tokens per second
+        await bucket.acquire(6000)
+        start = time.monotonic()
+        await bucket.acquire(10)
+        assert time.monotonic() - start >= 0.08
+    
+    @pytest.mark.asyncio
+    async def test_oversized_request_is_capped(self):
+        """Test that a request larger than the bucket is capped instead of waiting forever."""
+        from llm_client import TokenBucket
+        bucket = TokenBucket(600)
+        start = time.monotonic()
+        await bucket.acquire(10 ** 6)
+        assert time.monotonic() - start < 0.05
@@ -3,49 +3,126 @@ Tests for the talent scraper API.
 To run these tests:
     pytest -xvs tests/test_talent_scraper_api.py
 """
+import asyncio
+import json
+import uuid
 import pytest
-from fastapi.testclient import TestClient
-from app import app
-import os
+import pytest_asyncio
 
-# Test client for FastAPI
-client = TestClient(app)
+JSON_HEADERS = {"content-type": "application/json"}
+
+@pytest.fixture(scope="module")
+def chat_body():
+    """Build chat request bodies from a prefix serialized once; only the session id is appended."""
+    prefix = b'{"message": ' + json.dumps("Hello, what can you help me with?").encode() + b', "session_id": '
+    return lambda session_id: prefix + json.dumps(session_id).encode() + b'}'
+
+@pytest_asyncio.fixture(scope="class")
+async def scraper_session(aclient):
+    """One chat session shared by a test class, reset once when the class is done."""
+    sid = f"cls_{uuid.uuid4().hex}"
+    yield sid
+    await aclient.post(f"/api/v1/reset-conversation?session_id={sid}")
 
 class TestTalentScraperAPI:
     """Tests for the talent scraper API."""
     
-    def setup_method(self):
-        """Setup for tests."""
-        self.session_id = "test_session_123"
-    
-    @pytest.mark.skipif(not os.getenv("OPENAI_API_KEY") or not os.getenv("TAVILY_API_KEY"), 
-                        reason="API keys not available")
-    def test_chat_endpoint(self):
+    @pytest.mark.asyncio
+    async def test_chat_endpoint(self, aclient, scraper_session, chat_body, rjson):
         """Test the chat endpoint."""
-        response = client.post(
+        response = await aclient.post(
             "/api/v1/chat",
-            json={
-                "message": "Hello, what can you help me with?",
-                "session_id": self.session_id
-            }
+            content=chat_body(scraper_session),
+            headers=JSON_HEADERS
         )
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert "response" in data
         assert isinstance(data["response"], str)
         assert "session_id" in data
-        assert data["session_id"] == self.session_id
+        assert data["session_id"] == scraper_session
+    
+    @pytest.mark.asyncio
+    async def test_chat_stream_endpoint(self, aclient, scraper_session, chat_body):
+        """Test the streaming chat endpoint."""
+        response = await aclient.post(
+            "/api/v1/chat?stream=true",
+            content=chat_body(scraper_session),
+            headers=JSON_HEADERS
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert "event: result" in response.text
+        assert response.text.endswith("data: [DONE]\n\n")
+    
+    @pytest.mark.asyncio
+    async def test_chat_stream_released_on_disconnect(self, app_module, chat_body):
+        """Test that a stream closed before any of it is read frees its limiter slot and session lock."""
+        from talent_scraper.limiter import chat_limiter
+        from talent_scraper.sessions import find_chat_session
+        
+        session_id = f"disconnect_{uuid.uuid4().hex}"
+        messages = iter([{"type": "http.request", "body": chat_body(session_id), "more_body": False}])
+        
+        async def receive():
+            # The request body, then the client goes away
+            return next(messages, {"type": "http.disconnect"})
+        
+        async def send(message):
+            # The client never reads the response, so sending it never completes
+            await asyncio.Event().wait()
+        
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "POST",
+            "scheme": "http", "server": ("test", 80), "client": ("test", 1234), "root_path": "",
+            "path": "/api/v1/chat", "raw_path": b"/api/v1/chat", "query_string": b"stream=true",
+            "headers": [(b"host", b"test"), (b"content-type", b"application/json")]
+        }
+        await asyncio.wait_for(app_module(scope, receive, send), timeout=5)
+        
+        _, session_lock = find_chat_session(session_id)
+        assert chat_limiter.count == 0
+        assert not session_lock.locked()
+    
+    @pytest.mark.asyncio
+    async def test_chat_busy_returns_503(self, aclient, scraper_session, chat_body, monkeypatch):
+        """Test that a chat is turned away with 503 once the in-flight limit is reached."""
+        from talent_scraper.limiter import chat_limiter
+        monkeypatch.setattr(chat_limiter, "count", chat_limiter.limit)
+        response = await aclient.post(
+            "/api/v1/chat",
+            content=chat_body(scraper_session),
+            headers=JSON_HEADERS
+        )
+        assert response.status_code == 503
+    
+    @pytest.mark.asyncio
+    async def test_chat_is_recorded_in_session(self, aclient, scraper_session, chat_body, rjson):
+        """Test that a chat turn shows up in the summary of the same session."""
+        summary_url = f"/api/v1/conversation-summary?session_id={scraper_session}"
+        before = rjson(await aclient.get(summary_url))["conversation_length"]
+        response = await aclient.post(
+            "/api/v1/chat",
+            content=chat_body(scraper_session),
+            headers=JSON_HEADERS
+        )
+        assert response.status_code == 200
+        after = rjson(await aclient.get(summary_url))["conversation_length"]
+        assert after == before + 2
     
-    def test_reset_conversation(self):
+    @pytest.mark.asyncio
+    async def test_reset_conversation(self, aclient, scraper_session, rjson):
         """Test the reset conversation endpoint."""
-        response = client.post(f"/api/v1/reset-conversation?session_id={self.session_id}")
+        response = await aclient.post(f"/api/v1/reset-conversation?session_id={scraper_session}")
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert data["success"] is True
     
-    def test_conversation_summary(self):
+    @pytest.mark.asyncio
+    async def test_conversation_summary(self, aclient, scraper_session, rjson):
         """Test the conversation summary endpoint."""
-        response = client.get("/api/v1/conversation-summary")
+        response = await aclient.get(f"/api/v1/conversation-summary?session_id={scraper_session}")
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert "success" in data
+        assert "conversation_length" in data
@@ -0,0 +1,177 @@
+"""
+Unit tests for the talent scraper chatbot.
+To run these tests:
+    pytest -xvs tests/test_talent_scraper_chatbot.py
+"""
+import uuid
+import pytest
+from cachetools import TTLCache
+from httpx import Response
+from pydantic import ValidationError
+
+# The same Upwork profile twice (tracking parameters, trailing slash, host case) plus a GitHub one
+TAVILY_RESULTS = [
+    {
+        "title": "Alice - Senior React Developer",
+        "url": "https://www.upwork.com/freelancers/alice/?utm_source=search",
+        "content": "Senior React developer."
+    },
+    {
+        "title": "Alice - Senior React Developer",
+        "url": "https://WWW.upwork.com/freelancers/alice",
+        "content": "Senior React developer with 7 years of experience, Node.js and TypeScript. 4.9 stars, $60/hour."
+    },
+    {
+        "title": "Bob - React Engineer",
+        "url": "https://github.com/bob",
+        "content": "React and Python engineer, 5 years experience."
+    }
+]
+
+@pytest.fixture
+def chatbot():
+    """A chatbot with an empty conversation."""
+    from talent_scraper_chatbot import TalentScraperChatbot
+    return TalentScraperChatbot()
+
+@pytest.fixture
+def tavily_results(mock_apis):
+    """Make every mocked Tavily search return the canned profiles; yields the search route."""
+    route = mock_apis["tavily_search"]
+    route.mock(return_value=Response(200, json={"results": TAVILY_RESULTS}))
+    return route
+
+@pytest.fixture
+def empty_search_caches(monkeypatch):
+    """Fresh talent-search and formatted-reply caches, so results cached by other tests are not reused."""
+    import talent_scraper_chatbot
+    monkeypatch.setattr(talent_scraper_chatbot, "_talent_results_cache", TTLCache(maxsize=256, ttl=3600))
+    monkeypatch.setattr(talent_scraper_chatbot, "_results_response_cache", TTLCache(maxsize=256, ttl=3600))
+
+class TestIntentClassification:
+    """Tests for the local intent classifier."""
+    
+    @pytest.mark.parametrize("message, skills, quantity", [
+        ("Find me 3 senior React developers with AI experience", ["React", "AI"], 3),
+        ("I need a Python developer with 10 years of experience", ["Python"], None),
+        ("Hire 2 Node.js engineers", ["Node.js"], 2),
+    ])
+    def test_clear_talent_requests(self, chatbot, message, skills, quantity):
+        """Test that clear searches are classified without the LLM."""
+        intent = chatbot._classify_intent_locally(message)
+        assert intent["is_talent_request"] is True
+        assert intent["skills"] == skills
+        assert intent["quantity"] == quantity
+    
+    @pytest.mark.parametrize("message", ["Hello", "Thanks, that was helpful"])
+    def test_clear_small_talk(self, chatbot, message):
+        """Test that small talk is classified without the LLM."""
+        intent = chatbot._classify_intent_locally(message)
+        assert intent["is_talent_request"] is False
+        assert intent["skills"] == []
+    
+    @pytest.mark.parametrize("message", [
+        "Tell me about those engineers again",
+        "Are any of these experts available?",
+        "Find developers to maintain my site",
+        "My developers use Python at work; how do I motivate them?",
+        "I have 3 ai engineers already, what about salary?",
+        "What is React?",
+        "Need 5 developers",
+    ])
+    def test_ambiguous_messages_go_to_llm(self, chatbot, message):
+        """Test that anything short of a clear search or clear small talk is left to the LLM."""
+        assert chatbot._classify_intent_locally(message) is None
+
+class TestIntentSchema:
+    """Tests for parsing the intent-analysis reply."""
+    
+    def test_normalizes_fields(self):
+        """Test that capitalized and spelled-out null values are normalized and extra keys ignored."""
+        from talent_scraper_chatbot import IntentSchema
+        intent = IntentSchema.model_validate_json(
+            '{"is_talent_request": true, "skills": ["React"], "seniority": "Senior", '
+            '"quantity": 3, "platform_preference": "null", "confidence": 0.9}'
+        )
+        assert intent.is_talent_request is True
+        assert intent.seniority == "senior"
+        assert intent.platform_preference is None
+        assert intent.quantity == 3
+    
+    def test_rejects_unknown_seniority(self):
+        """Test that an unexpected seniority fails validation, so the keyword fallback is used."""
+        from talent_scraper_chatbot import IntentSchema
+        with pytest.raises(ValidationError):
+            IntentSchema.model_validate_json('{"is_talent_request": true, "seniority": "wizard"}')
+
+class TestTalentSearch:
+    """Tests for the Tavily search, extraction and caching path."""
+    
+    @pytest.mark.asyncio
+    async def test_execute_searches_dedups_by_normalized_url(self, chatbot, tavily_results):
+        """Test that the same profile found by several queries is kept once, with its longest content."""
+        results = await chatbot._execute_searches(["react developer upwork", "react developer github"])
+        
+        assert tavily_results.call_count == 2
+        assert len(results) == 2
+        alice = next(result for result in results if "alice" in result["url"])
+        assert alice["content"] == TAVILY_RESULTS[1]["content"]
+    
+    @pytest.mark.asyncio
+    async def test_repeated_search_is_cached(self, chatbot, tavily_results, empty_search_caches):
+        """Test that a differently worded request for the same search reuses the ranked candidates."""
+        intent = {"is_talent_request": True, "skills": ["React"], "seniority": "senior", "quantity": 2}
+        first = await chatbot._search_talent_with_tavily("Find 2 senior React developers", intent)
+        searches = tavily_results.call_count
+        second = await chatbot._search_talent_with_tavily("I need 2 React devs, senior level", intent)
+        
+        assert searches > 0
+        assert tavily_results.call_count == searches
+        assert [talent.profile_url for talent in second] == [talent.profile_url for talent in first]
+        assert len(first) == 2
+    
+    @pytest.mark.asyncio
+    async def test_results_response_is_cached(self, chatbot, tavily_results, empty_search_caches, mock_apis):
+        """Test that formatting the same candidates again does not call OpenAI a second time."""
+        intent = {"is_talent_request": True, "skills": ["React"], "seniority": "senior", "quantity": 2}
+        talents = await chatbot._search_talent_with_tavily("Find 2 senior React developers", intent)
+        
+        first = await chatbot._generate_results_response(talents, intent)
+        second = await chatbot._generate_results_response(talents, intent)
+        
+        assert second == first
+        assert mock_apis["openai_chat"].call_count == 1
+
+class TestHistoryCompaction:
+    """Tests for folding older conversation turns into the running summary."""
+    
+    @staticmethod
+    def _history(size):
+        # Unique text per test, so summaries cached by other tests are not reused
+        tag = uuid.uuid4().hex
+        return [{"role": "user" if i % 2 == 0 else "assistant", "content": f"{tag} message {i}"} for i in range(size)]
+    
+    @pytest.mark.asyncio
+    async def test_keeps_most_recent_messages_in_order(self, chatbot, openai_reply):
+        """Test that only the newest messages remain, in order, once they are summarized."""
+        from talent_scraper_chatbot import HISTORY_KEEP_RECENT
+        openai_reply("They asked for React developers.")
+        history = self._history(25)
+        chatbot.conversation_history = list(history)
+        
+        await chatbot._compact_history()
+        
+        assert chatbot.conversation_history == history[-HISTORY_KEEP_RECENT:]
+        assert chatbot.history_summary == "They asked for React developers."
+    
+    @pytest.mark.asyncio
+    async def test_keeps_history_when_summary_fails(self, chatbot, mock_apis):
+        """Test that a failed summarization drops nothing, so the next turn can retry."""
+        mock_apis["openai_chat"].mock(return_value=Response(400, json={"error": {"message": "bad request"}}))
+        history = self._history(25)
+        chatbot.conversation_history = list(history)
+        
+        await chatbot._compact_history()
+        
+        assert chatbot.conversation_history == history
+        assert chatbot.history_summary is None
@@ -4,47 +4,115 @@ To run these tests:
     pytest -xvs tests/test_term_simplifier_api.py
 """
 import pytest
-from fastapi.testclient import TestClient
-from app import app
-import os
-
-# Test client for FastAPI
-client = TestClient(app)
 
 class TestTermSimplifierAPI:
     """Tests for the term simplifier API."""
     
-    @pytest.mark.skipif(not os.getenv("OPENAI_API_KEY"), 
-                        reason="OpenAI API key not available")
-    def test_explain_endpoint(self):
-        """Test the explain endpoint."""
+    @pytest.mark.parametrize("term,context", [
+        ("API", "Web development"),
+        ("REST", "HTTP APIs"),
+        ("JWT", "authentication"),
+        ("CORS", "browsers"),
+        ("OAuth", "authorization"),
+    ])
+    def test_explain_endpoint(self, client, request, openai_reply, isolated_cache, fresh_simplifier, term, context, rjson):
+        """Test the explain endpoint; the caches start out without these terms so the mocked reply is used."""
+        openai_reply(f"{term} explained simply.")
+        # The first run records the response in .pytest_cache; later runs check its shape still matches
+        # (pytest --cache-clear to re-record); without the cache provider nothing is recorded
+        cache = getattr(request.config, "cache", None)
+        cache_key = f"explain/{term}-{context.replace(' ', '_')}"
+        recorded = cache.get(cache_key, None) if cache is not None else None
         response = client.post(
             "/simplifier/explain",
             json={
-                "term": "API",
-                "context": "Web development"
+                "term": term,
+                "context": context
             }
         )
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert "term" in data
-        assert data["term"] == "API"
+        assert data["term"] == term
         assert "explanation" in data
-        assert isinstance(data["explanation"], str)
+        assert data["explanation"] == f"{term} explained simply."
+        if cache is None:
+            return
+        if recorded is None:
+            cache.set(cache_key, data)
+        else:
+            assert set(data) == set(recorded)
+    
+    def test_explain_depends_on_context(self, client, openai_reply, isolated_cache, fresh_simplifier, rjson):
+        """Test that an explanation for one context is not reused for another."""
+        explanations = []
+        for context, reply in (("Web development", "A waiter for programs."), ("Game design", "A rulebook for mods.")):
+            openai_reply(reply)
+            response = client.post("/simplifier/explain", json={"term": "API", "context": context})
+            assert response.status_code == 200
+            explanations.append(rjson(response)["explanation"])
+        assert explanations == ["A waiter for programs.", "A rulebook for mods."]
+    
+    def test_explain_semantic_hit_skips_chat(self, client, mock_apis, openai_reply, isolated_cache, fresh_simplifier, rjson):
+        """Test that a near-duplicate term is answered from the semantic cache without a chat completion."""
+        openai_reply("A waiter for programs.")
+        client.post("/simplifier/explain", json={"term": "API", "context": "Web development"})
+        mock_apis["openai_chat"].reset()
+        
+        # "api" has its own exact cache key but the same embedding as "API"
+        response = client.post("/simplifier/explain", json={"term": "api", "context": "Web development"})
+        assert rjson(response)["explanation"] == "A waiter for programs."
+        assert mock_apis["openai_chat"].call_count == 0
+    
+    def test_explain_stream_endpoint(self, client):
+        """Test the streaming explain endpoint."""
+        response = client.post(
+            "/simplifier/explain?stream=true",
+            json={
+                "term": "JSON"
+            }
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [line[len("data: "):] for line in response.text.splitlines() if line.startswith("data: ")]
+        assert events[-1] == "[DONE]"
+        assert len(events) > 1
+    
+    def test_explain_batch_endpoint(self, client, rjson):
+        """Test the batch explain endpoint."""
+        response = client.post(
+            "/simplifier/explain-batch",
+            json={
+                "terms": ["API", "JSON"],
+                "context": "Web development"
+            }
+        )
+        assert response.status_code == 200
+        data = rjson(response)
+        assert "results" in data
+        assert [result["term"] for result in data["results"]] == ["API", "JSON"]
+        assert all(isinstance(result["explanation"], str) for result in data["results"])
+    
+    def test_explain_batch_requires_terms(self, client):
+        """Test that the batch endpoint rejects an empty term list."""
+        response = client.post("/simplifier/explain-batch", json={"terms": ["  "]})
+        assert response.status_code == 400
     
-    def test_cache_stats(self):
+    def test_cache_stats(self, client, isolated_cache, rjson):
         """Test the cache stats endpoint."""
         response = client.get("/simplifier/cache/stats")
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert "total_cached_terms" in data
         assert "cached_terms" in data
         assert isinstance(data["cached_terms"], list)
+        assert sorted(data["cached_terms"]) == ["API", "JSON"]
     
-    def test_clear_cache(self):
+    def test_clear_cache(self, client, isolated_cache, rjson):
         """Test clearing the cache."""
         response = client.delete("/simplifier/cache/clear")
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert "status" in data
         assert data["status"] == "success"
+        assert data["message"] == "Cache cleared. 2 terms removed."